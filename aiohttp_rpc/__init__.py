@@ -1,5 +1,7 @@
 from . import client, constants, decorators, errors, middlewares, protocol, server, utils  # noqa: F401
-from .client import BaseJsonRpcClient, JsonRpcClient, WsJsonRpcClient  # noqa: F401
+from .client import (  # noqa: F401
+    BaseJsonRpcClient, JsonRpcClient, WsJsonRpcClient, close_shared_session, get_shared_session,
+)
 from .decorators import rpc_method  # noqa: F401
 from .protocol import *  # noqa: F401 F403
 from .server import BaseJsonRpcServer, JsonRpcServer, WsJsonRpcServer, rpc_server  # noqa: F401
@@ -1,3 +1,4 @@
 from .base import *  # noqa: F401 F403
 from .http import *  # noqa: F401 F403
+from .session import *  # noqa: F401 F403
 from .websocket import *  # noqa: F401 F403
@@ -1,4 +1,8 @@
+from __future__ import annotations
+
 import abc
+import asyncio
+import itertools
 import types
 import typing
 from functools import partial
@@ -12,12 +16,16 @@ __all__ = (
 
 
 class BaseJsonRpcClient(abc.ABC):
-    error_map: typing.Mapping[int, typing.Type[errors.JsonRpcError]] = {
-        error.code: error
-        for error in errors.DEFAULT_KNOWN_ERRORS
-    }
+    error_map: typing.Mapping[int, typing.Type[errors.JsonRpcError]] = errors.DEFAULT_ERROR_MAP
+    max_cached_methods: typing.ClassVar[int] = 128
+
+    def __init__(self, *, id_factory: typing.Optional[typing.Callable[[], typedefs.JsonRpcIdType]] = None) -> None:
+        # Ids only have to be unique among the requests of one client, so a counter is enough by default.
+        # Use `utils.get_random_id` as `id_factory` if ids must be unguessable
+        # or if they must not collide with ids of requests that are made by hand.
+        self._get_next_id = itertools.count(1).__next__ if id_factory is None else id_factory  # type: ignore
 
-    async def __aenter__(self) -> 'BaseJsonRpcClient':
+    async def __aenter__(self) -> BaseJsonRpcClient:
         await self.connect()
         return self
 
@@ -28,7 +36,19 @@ class BaseJsonRpcClient(abc.ABC):
         await self.disconnect()
 
     def __getattr__(self, method_name: str) -> typing.Callable:
-        return partial(self.call, method_name)
+        if method_name.startswith('__'):
+            raise AttributeError(method_name)
+
+        method = partial(self.call, method_name)
+        cached_methods_count = self.__dict__.get('_cached_methods_count', 0)
+
+        # Python doesn't call `__getattr__` for attributes that are in `__dict__`.
+        # The number of cached methods is limited, because names can be dynamic.
+        if cached_methods_count < self.max_cached_methods:
+            self.__dict__[method_name] = method
+            self.__dict__['_cached_methods_count'] = cached_methods_count + 1
+
+        return method
 
     @abc.abstractmethod
     async def connect(self) -> None:
@@ -39,7 +59,7 @@ class BaseJsonRpcClient(abc.ABC):
         pass
 
     async def call(self, method_name: str, *args, **kwargs) -> typing.Any:
-        request = protocol.JsonRpcRequest(id=utils.get_random_id(), method_name=method_name, args=args, kwargs=kwargs)
+        request = protocol.JsonRpcRequest(id=self._get_next_id(), method_name=method_name, args=args, kwargs=kwargs)
         response = await self.direct_call(request)
 
         assert response is not None  # Because it isn't a notification
@@ -55,48 +75,51 @@ class BaseJsonRpcClient(abc.ABC):
 
     async def batch(self,
                     method_descriptions: typedefs.ClientMethodDescriptionsType, *,
-                    save_order: bool = True) -> typing.Sequence:
+                    save_order: bool = True,
+                    parallel: bool = False) -> typing.Sequence:
+        if parallel:
+            # Each response matches its request, so the order is always saved.
+            return await self._send_in_parallel(method_descriptions)
+
         if isinstance(method_descriptions, protocol.JsonRpcBatchRequest):
             batch_request = method_descriptions
         else:
-            batch_request = protocol.JsonRpcBatchRequest(requests=tuple(
-                self._parse_method_description(method_description)
-                for method_description in method_descriptions
-            ))
+            batch_request = self._parse_method_descriptions(method_descriptions)
 
         batch_response = await self.direct_batch(batch_request)
 
         assert batch_response is not None  # Because it isn't a notification
 
         if save_order:
-            return utils.collect_batch_result(batch_request, batch_response)
+            request_ids = tuple([request.id for request in batch_request.requests])
+            return utils.collect_batch_result_by_ids(request_ids, batch_response)
         else:
-            return tuple(
+            return tuple([
                 response.result if response.error is None else response.error
                 for response in batch_response.responses
-            )
+            ])
 
     async def batch_notify(self, method_descriptions: typedefs.ClientMethodDescriptionsType) -> None:
+        batch_request: protocol.JsonRpcBatchRequest
+
         if isinstance(method_descriptions, protocol.JsonRpcBatchRequest):
             batch_request = method_descriptions
         else:
-            batch_request = protocol.JsonRpcBatchRequest(requests=tuple(
-                self._parse_method_description(method_description, is_notification=True)
-                for method_description in method_descriptions
-            ))
+            batch_request = self._parse_method_descriptions(method_descriptions, is_notification=True)
 
         await self.direct_batch(batch_request)
 
     async def direct_call(self,
                           request: protocol.JsonRpcRequest,
                           **kwargs) -> typing.Optional[protocol.JsonRpcResponse]:
+        is_notification = request.id is None
         json_response, context = await self.send_json(
             request.dump(),
-            without_response=request.is_notification,
+            without_response=is_notification,
             **kwargs,
         )
 
-        if request.is_notification:
+        if is_notification:
             return None
 
         response = protocol.JsonRpcResponse.load(
@@ -110,13 +133,21 @@ class BaseJsonRpcClient(abc.ABC):
     async def direct_batch(self,
                            batch_request: protocol.JsonRpcBatchRequest,
                            **kwargs) -> typing.Optional[protocol.JsonRpcBatchResponse]:
-        if not batch_request.requests:
-            raise errors.InvalidRequest('You can\'t send an empty batch request.')
+        return await self._send_batch(
+            batch_request.dump(),
+            is_notification=batch_request.is_notification,
+            **kwargs,
+        )
 
-        is_notification = batch_request.is_notification
+    async def _send_batch(self,
+                          batch_data: typing.Sequence[typing.Mapping[str, typing.Any]], *,
+                          is_notification: bool,
+                          **kwargs) -> typing.Optional[protocol.JsonRpcBatchResponse]:
+        if not batch_data:
+            raise errors.InvalidRequest('You can\'t send an empty batch request.')
 
         json_response, context = await self.send_json(
-            batch_request.dump(),
+            batch_data,
             without_response=is_notification,
             **kwargs,
         )
@@ -127,7 +158,37 @@ class BaseJsonRpcClient(abc.ABC):
         if not json_response:
             raise errors.ParseError('Server returned an empty batch response.')
 
-        return protocol.JsonRpcBatchResponse.load(json_response)
+        return protocol.JsonRpcBatchResponse.load(json_response, error_map=self.error_map, context=context)
+
+    async def _send_in_parallel(self, method_descriptions: typedefs.ClientMethodDescriptionsType) -> typing.Tuple:
+        if isinstance(method_descriptions, protocol.JsonRpcBatchRequest):
+            requests = method_descriptions.requests
+        else:
+            requests = self._parse_method_descriptions(method_descriptions).requests
+
+        if not requests:
+            raise errors.InvalidRequest('You can\'t send an empty batch request.')
+
+        # All requests are awaited even if some of them fail.
+        responses = await asyncio.gather(*(
+            self.direct_call(request)
+            for request in requests
+        ), return_exceptions=True)
+
+        # Results are returned like in a batch: errors are values, notifications get `None`.
+        results: typing.List[typing.Any] = []
+
+        for response in responses:
+            if isinstance(response, errors.JsonRpcError):
+                results.append(response)
+            elif isinstance(response, BaseException):
+                raise response
+            elif response is None:
+                results.append(None)
+            else:
+                results.append(response.result if response.error is None else response.error)
+
+        return tuple(results)
 
     @abc.abstractmethod
     async def send_json(self,
@@ -141,37 +202,64 @@ class BaseJsonRpcClient(abc.ABC):
         return utils.json_serialize(data)
 
     @staticmethod
-    def json_deserialize(data: str) -> typing.Any:
-        return utils.json_deserialize(data)
+    def json_serialize_bytes(data: typing.Any) -> bytes:
+        return utils.json_serialize_bytes(data)
 
     @staticmethod
-    def _parse_method_description(method_description: typedefs.ClientMethodDescriptionType, *,
-                                  is_notification: bool = False) -> protocol.JsonRpcRequest:
-        if isinstance(method_description, protocol.JsonRpcRequest):
-            return method_description
+    def json_deserialize(data: typing.Union[str, bytes]) -> typing.Any:
+        return utils.json_deserialize(data)
+
+    def _json_serialize_bytes(self, data: typing.Any) -> bytes:
+        if self._can_serialize_bytes():
+            return self.json_serialize_bytes(data)
+
+        return self.json_serialize(data).encode()
+
+    def _can_serialize_bytes(self) -> bool:
+        # An overridden `json_serialize` is respected, if `json_serialize_bytes` isn't overridden too.
+        return (
+            self.json_serialize_bytes is not BaseJsonRpcClient.json_serialize_bytes
+            or self.json_serialize is BaseJsonRpcClient.json_serialize
+        )
 
-        request_id = None if is_notification else utils.get_random_id()
+    def _get_next_id(self) -> typedefs.JsonRpcIdType:
+        # It is used only if a subclass doesn't call `__init__` of this class, the instance attribute shadows it.
+        self._get_next_id = itertools.count(1).__next__  # type: ignore
+        return self._get_next_id()
+
+    def _parse_method_descriptions(self,
+                                   method_descriptions: typing.Iterable[typedefs.ClientMethodDescriptionType], *,
+                                   is_notification: bool = False) -> protocol.JsonRpcBatchRequest:
+        request_cls = protocol.JsonRpcRequest
+        get_next_id = self._get_next_id
+        parse_method_description = self._parse_method_description
+
+        return protocol.JsonRpcBatchRequest(requests=tuple([
+            method_description
+            if isinstance(method_description, request_cls)
+            else parse_method_description(method_description, None if is_notification else get_next_id())
+            for method_description in method_descriptions
+        ]))
 
+    @staticmethod
+    def _parse_method_description(method_description: typing.Union[str, typing.Sequence],
+                                  request_id: typing.Optional[typedefs.JsonRpcIdType]) -> protocol.JsonRpcRequest:
         if isinstance(method_description, str):
-            return protocol.JsonRpcRequest(
-                id=request_id,
-                method_name=method_description,
-            )
+            return protocol.JsonRpcRequest(id=request_id, method_name=method_description)
 
-        if len(method_description) == 1:
-            return protocol.JsonRpcRequest(
-                id=request_id,
-                method_name=method_description[0],
-            )
+        size = len(method_description)
+
+        if size == 1:
+            return protocol.JsonRpcRequest(id=request_id, method_name=method_description[0])
 
-        if len(method_description) == 2:
+        if size == 2:
             return protocol.JsonRpcRequest(
                 id=request_id,
                 method_name=method_description[0],
                 params=method_description[1],
             )
 
-        if len(method_description) == 3:
+        if size == 3:
             return protocol.JsonRpcRequest(
                 id=request_id,
                 method_name=method_description[0],
@@ -1,58 +1,238 @@
+from __future__ import annotations
+
+import asyncio
+import re
 import typing
 
 import aiohttp
+from aiohttp import hdrs
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
 
 from .base import BaseJsonRpcClient
-from .. import errors, utils
+from .session import get_shared_session
+from .. import errors, protocol, typedefs, utils
 
 
 __all__ = (
     'JsonRpcClient',
 )
 
+JSON_CONTENT_TYPE_RE = re.compile(r'^application/(?:[\w.+-]+?\+)?json')
+
 
 class JsonRpcClient(BaseJsonRpcClient):
-    url: str
+    default_headers: typing.ClassVar[CIMultiDictProxy] = CIMultiDictProxy(CIMultiDict({
+        hdrs.CONTENT_TYPE: 'application/json',
+    }))
+    # Only responses with a matching mimetype are decoded.
+    content_type_re: typing.ClassVar[typing.Pattern] = JSON_CONTENT_TYPE_RE
     session: typing.Optional[aiohttp.ClientSession]
     request_kwargs: dict
+    # Defaults of attributes that were added after `__init__` could be overridden without calling it.
+    _raw_url: str
+    _url: typing.Optional[URL] = None
     _session_is_outer: bool
+    _use_shared_session: bool = False
+    _connector_kwargs: typing.Optional[typing.Mapping[str, typing.Any]] = None
+    _auto_batch: bool = False
+    _max_batch_size: typing.Optional[int] = None
+    _pending_batch: typing.List[typing.Tuple[protocol.JsonRpcRequest, asyncio.Future]]
+    _flush_handle: typing.Optional[asyncio.Handle] = None
+    _background_tasks: typing.Set
 
     def __init__(self,
                  url: str, *,
                  session: typing.Optional[aiohttp.ClientSession] = None,
+                 use_shared_session: bool = False,
+                 connector_kwargs: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+                 auto_batch: bool = False,
+                 max_batch_size: typing.Optional[int] = None,
+                 id_factory: typing.Optional[typing.Callable[[], typedefs.JsonRpcIdType]] = None,
                  **request_kwargs) -> None:
+        assert max_batch_size is None or max_batch_size > 0
+        assert not (use_shared_session and request_kwargs), 'The shared session is created without request kwargs.'
+        assert connector_kwargs is None or 'connector' not in request_kwargs, 'Use connector or connector_kwargs.'
+        assert not (use_shared_session and connector_kwargs), 'The shared session is created without connector kwargs.'
+        assert session is None or connector_kwargs is None, 'An outer session is used without connector kwargs.'
+
+        super().__init__(id_factory=id_factory)
+
         self.url = url
         self.session = session
         self.request_kwargs = request_kwargs
         self._session_is_outer = session is not None  # We don't close an outer session.
+        self._use_shared_session = use_shared_session
+        # A connector must be created in a running event loop, so it is created in `connect`.
+        self._connector_kwargs = connector_kwargs
+
+        # Calls made during the same loop iteration are sent as one batch request.
+        self._auto_batch = auto_batch
+        self._max_batch_size = max_batch_size
+        self._pending_batch = []
+        self._background_tasks = set()
+
+    @property
+    def url(self) -> str:
+        return self._raw_url
+
+    @url.setter
+    def url(self, url: str) -> None:
+        self._raw_url = url
+        self._url = None  # The URL is parsed once in `send_json` to skip parsing for each request.
 
     async def connect(self) -> None:
         if self.session is None:
-            self.session = aiohttp.ClientSession(json_serialize=self.json_serialize, **self.request_kwargs)
+            if self._use_shared_session:
+                # It allows short-lived clients to reuse connections.
+                self.session = get_shared_session()
+                self._session_is_outer = True
+            else:
+                session_kwargs = self.request_kwargs
+
+                if self._connector_kwargs is not None:
+                    session_kwargs = {'connector': aiohttp.TCPConnector(**self._connector_kwargs), **session_kwargs}
+
+                self.session = aiohttp.ClientSession(json_serialize=self.json_serialize, **session_kwargs)
 
     async def disconnect(self) -> None:
+        if self._auto_batch:
+            self._flush_pending_batch()
+
+            if self._background_tasks:
+                await asyncio.gather(*self._background_tasks, return_exceptions=True)
+
         if self.session is not None and not self._session_is_outer:
             await self.session.close()
 
+    async def call(self, method_name: str, *args, **kwargs) -> typing.Any:
+        if not self._auto_batch:
+            return await super().call(method_name, *args, **kwargs)
+
+        request = protocol.JsonRpcRequest(id=self._get_next_id(), method_name=method_name, args=args, kwargs=kwargs)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending_batch.append((request, future))
+
+        if self._max_batch_size is not None and len(self._pending_batch) >= self._max_batch_size:
+            self._flush_pending_batch()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_soon(self._flush_pending_batch)
+
+        response: protocol.JsonRpcResponse = await future
+
+        if response.error is not None:
+            raise response.error
+
+        return response.result
+
     async def send_json(self,
                         data: typing.Any, *,
                         without_response: bool = False,
                         **kwargs) -> typing.Tuple[typing.Any, typing.Optional[dict]]:
         assert self.session is not None
 
-        http_response = await self.session.post(self.url, json=data, **kwargs)
+        headers: typing.Mapping = self.default_headers
+        extra_headers = kwargs.pop('headers', None)
+
+        if extra_headers:
+            headers = CIMultiDict(headers)
+            headers.update(extra_headers)
+
+        url = self._url
+
+        if url is None:
+            url = self._url = URL(self.url)
+
+        if self._uses_session_json_serialize():
+            http_response = await self.session.post(url, json=data, headers=headers, **kwargs)
+        else:
+            # The body is serialized here to skip the intermediate `str` of `json=data`.
+            body = self._json_serialize_bytes(data)
+            http_response = await self.session.post(url, data=body, headers=headers, **kwargs)
 
         try:
             http_response.raise_for_status()
         except aiohttp.ClientResponseError as e:
             raise errors.ServerError(f'Server responded with code {http_response.status}.') from e
 
-        try:
-            json_response = await http_response.json(loads=self.json_deserialize)
-        except aiohttp.ContentTypeError as e:
-            raise errors.ParseError(utils.get_exc_message(e)) from e
-
         if without_response:
+            # The body isn't needed, so the connection is returned to the pool without reading it.
+            await http_response.release()
             return None, None
 
+        # The mimetype is checked by headers, so an unexpected body isn't even read.
+        if not self.content_type_re.match(http_response.content_type):
+            await http_response.release()
+            raise errors.ParseError(f'Attempt to decode JSON with unexpected mimetype: {http_response.content_type}')
+
+        # The raw body is decoded at once, `http_response.json()` would make an intermediate `str`.
+        body = await http_response.read()
+
+        try:
+            json_response = self.json_deserialize(body) if body and not body.isspace() else None
+        except ValueError as e:
+            raise errors.ParseError(utils.get_exc_message(e)) from e
+
         return json_response, {'http_response': http_response}
+
+    def _uses_session_json_serialize(self) -> bool:
+        # An outer session can have its own `json_serialize`, it is used if the client doesn't override serializers.
+        return (
+            self._session_is_outer
+            and not self._use_shared_session
+            and self.json_serialize is BaseJsonRpcClient.json_serialize
+            and self.json_serialize_bytes is BaseJsonRpcClient.json_serialize_bytes
+        )
+
+    def _flush_pending_batch(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if not self._pending_batch:
+            return
+
+        pending_batch, self._pending_batch = self._pending_batch, []
+        task = asyncio.create_task(self._send_pending_batch(pending_batch))
+
+        # To avoid a task disappearing mid execution:
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _send_pending_batch(self,
+                                  pending_batch: typing.Sequence[typing.Tuple[protocol.JsonRpcRequest, asyncio.Future]],
+                                  ) -> None:
+        try:
+            if len(pending_batch) == 1:
+                request, future = pending_batch[0]
+                response = await self.direct_call(request)
+
+                if not future.done():
+                    future.set_result(response)
+
+                return
+
+            batch_request = protocol.JsonRpcBatchRequest(requests=tuple([request for request, _ in pending_batch]))
+            batch_response = await self.direct_batch(batch_request)
+        except Exception as e:
+            for _, future in pending_batch:
+                if not future.done():
+                    future.set_exception(e)
+
+            return
+
+        assert batch_response is not None  # Because it isn't a notification
+
+        responses_map = {
+            response.id: response
+            for response in batch_response.responses
+        }
+        # A response without an id (e.g. a parse error) is related to all requests.
+        unlinked_response = responses_map.get(None) or protocol.JsonRpcResponse(
+            error=errors.ServerError('Server did not return a response for the request.'),
+        )
+
+        for request, future in pending_batch:
+            if not future.done():
+                future.set_result(responses_map.get(request.id, unlinked_response))
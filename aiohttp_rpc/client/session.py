@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import asyncio
+import typing
+import weakref
+
+import aiohttp
+
+from .. import utils
+
+
+__all__ = (
+    'get_shared_session',
+    'close_shared_session',
+)
+
+# A session is bound to an event loop, so there is one shared session per loop.
+_shared_sessions: typing.MutableMapping[asyncio.AbstractEventLoop, aiohttp.ClientSession] = weakref.WeakKeyDictionary()
+
+
+def get_shared_session() -> aiohttp.ClientSession:
+    loop = asyncio.get_running_loop()
+    session = _shared_sessions.get(loop)
+
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(json_serialize=utils.json_serialize)
+        _shared_sessions[loop] = session
+
+    return session
+
+
+async def close_shared_session() -> None:
+    session = _shared_sessions.pop(asyncio.get_running_loop(), None)
+
+    if session is not None:
+        await session.close()
@@ -1,11 +1,15 @@
+from __future__ import annotations
+
 import asyncio
 import logging
+import math
 import typing
+from functools import partial
 
 from aiohttp import ClientSession, http_websocket, web_ws
 
 from .base import BaseJsonRpcClient
-from .. import errors, typedefs, utils
+from .. import constants, errors, typedefs, utils
 
 
 __all__ = (
@@ -14,15 +18,28 @@ __all__ = (
 
 logger = logging.getLogger(__name__)
 
+DATA_WS_MSG_TYPES = frozenset((
+    http_websocket.WSMsgType.TEXT,
+    http_websocket.WSMsgType.BINARY,
+))
+CLOSING_WS_MSG_TYPES = frozenset((
+    http_websocket.WSMsgType.CLOSE,
+    http_websocket.WSMsgType.CLOSING,
+    http_websocket.WSMsgType.CLOSED,
+))
+
 
 class WsJsonRpcClient(BaseJsonRpcClient):
+    # If it is set, timeouts can fire later by this value, but requests sent at close times share one timer.
+    timeout_resolution: typing.ClassVar[typing.Optional[float]] = None
     url: typing.Optional[str]
     ws_connect: typing.Optional[typedefs.WSConnectType]
     ws_connect_kwargs: dict
     _timeout: typing.Optional[float]
     _timeout_for_data_receiving: typing.Optional[float]
     _connection_check_interval: typing.Optional[float]
-    _pending: typing.Dict[typing.Any, asyncio.Future]
+    _pending: typing.Dict[typedefs.JsonRpcIdType, asyncio.Future]
+    _timeout_buckets: typing.Dict[int, typing.Dict[asyncio.Future, typing.Sequence[typedefs.JsonRpcIdType]]]
     _message_worker: typing.Optional[asyncio.Future] = None
     _check_worker: typing.Optional[asyncio.Future] = None
     _session_is_outer: bool
@@ -30,6 +47,15 @@ class WsJsonRpcClient(BaseJsonRpcClient):
     _json_request_handler: typing.Optional[typing.Callable] = None
     _unprocessed_json_response_handler: typing.Optional[typing.Callable] = None
     _background_tasks: typing.Set
+    # Defaults of attributes that were added after `__init__` could be overridden without calling it.
+    _use_binary_frames: bool = False
+    _large_message_size: typing.Optional[int] = None
+    _writer_limit: typing.Optional[int] = None
+    _batch_window: typing.Optional[float] = None
+    _send_window: typing.Optional[typing.List[typing.Tuple[dict, asyncio.Future]]] = None
+    _send_str: typing.Callable[..., typing.Awaitable[None]]
+    _send_bytes: typing.Callable[..., typing.Awaitable[None]]
+    _send_frame: typing.Optional[typing.Callable[..., typing.Awaitable[None]]] = None
     _is_closed: bool = True
 
     def __init__(self,
@@ -41,9 +67,18 @@ class WsJsonRpcClient(BaseJsonRpcClient):
                  connection_check_interval: typing.Optional[float] = 5,
                  json_request_handler: typing.Optional[typing.Callable] = None,
                  unprocessed_json_response_handler: typing.Optional[typing.Callable] = None,
+                 use_binary_frames: bool = False,
+                 id_factory: typing.Optional[typing.Callable[[], typedefs.JsonRpcIdType]] = None,
+                 json_serialize: typing.Optional[typedefs.JSONEncoderType] = None,
+                 json_deserialize: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None,
+                 large_message_size: typing.Optional[int] = None,
+                 writer_limit: typing.Optional[int] = None,
+                 batch_window: typing.Optional[float] = None,
                  **ws_connect_kwargs) -> None:
         assert (session is not None) or (url is not None and session is None) or (ws_connect is not None)
 
+        super().__init__(id_factory=id_factory)
+
         self.url = url
         self._timeout = timeout
         self._timeout_for_data_receiving = timeout_for_data_receiving
@@ -56,10 +91,39 @@ class WsJsonRpcClient(BaseJsonRpcClient):
         self.ws_connect_kwargs = ws_connect_kwargs
         self._ws_connect_is_outer = ws_connect is not None  # We don't close an outer WS connection.
 
+        if ws_connect is not None:
+            # An outer WS connection can be used without `connect` (e.g. to send requests from a server).
+            self._bind_ws_connect_methods()
+
         self._pending = {}
+        self._timeout_buckets = {}
         self._json_request_handler = json_request_handler
         self._unprocessed_json_response_handler = unprocessed_json_response_handler
         self._background_tasks = set()
+        # Binary frames skip the `str` -> `bytes` encoding, but the other side must accept them.
+        self._use_binary_frames = use_binary_frames
+        # Messages of this size (or bigger) are decoded in the default executor of the loop.
+        # It helps only if the decoder releases the GIL (or on free-threaded builds of Python).
+        self._large_message_size = large_message_size
+        # The writer waits for draining of a paused transport when buffered data exceed the limit.
+        # A bigger limit (e.g. `2 ** 20`) lets bursts of messages be buffered without waiting.
+        self._writer_limit = writer_limit
+        # Single requests sent within this window (in seconds) are coalesced into one batch (one frame).
+        # It reduces overhead of frames for pipelined calls, but a result comes with the slowest one of the batch.
+        self._batch_window = batch_window
+
+        # Custom functions (e.g. `utils.orjson_serialize`) replace the default ones on the instance.
+        if json_serialize is not None:
+            self.json_serialize = json_serialize  # type: ignore
+
+            json_serialize_bytes = utils.get_bytes_serializer(json_serialize)
+
+            # Otherwise `_json_serialize_bytes` encodes the result of the custom `json_serialize`.
+            if json_serialize_bytes is not None:
+                self.json_serialize_bytes = json_serialize_bytes  # type: ignore
+
+        if json_deserialize is not None:
+            self.json_deserialize = json_deserialize  # type: ignore
 
     async def connect(self) -> None:
         self._is_closed = False
@@ -76,11 +140,25 @@ class WsJsonRpcClient(BaseJsonRpcClient):
                 await self.disconnect()
                 raise
 
+            if self._writer_limit is not None:
+                self._set_writer_limit(self._writer_limit)
+
+        self._bind_ws_connect_methods()
         self._message_worker = asyncio.create_task(self._handle_ws_messages())
 
         if self._connection_check_interval is not None:
             self._check_worker = asyncio.create_task(self._check_ws_connection())
 
+    def _set_writer_limit(self, writer_limit: int) -> None:
+        # `ws_connect` of `aiohttp` doesn't have an argument for it, so a private attribute is changed.
+        writer = getattr(self.ws_connect, '_writer', None)
+
+        if writer is None or not hasattr(writer, '_limit'):
+            logger.warning('Can\'t set the writer limit, it isn\'t supported by this version of aiohttp.')
+            return
+
+        writer._limit = writer_limit
+
     async def disconnect(self) -> None:
         self._is_closed = True
 
@@ -100,103 +178,269 @@ class WsJsonRpcClient(BaseJsonRpcClient):
             self._check_worker.cancel()
             await self._check_worker
 
+    def _bind_ws_connect_methods(self) -> None:
+        assert self.ws_connect is not None
+
+        # Bound methods are cached, because they are used for each message.
+        self._send_str = self.ws_connect.send_str
+        self._send_bytes = self.ws_connect.send_bytes
+        # `send_frame` is available since `aiohttp==3.11`.
+        self._send_frame = getattr(self.ws_connect, 'send_frame', None)
+
     async def send_json(self,
                         data: typing.Any, *,
                         without_response: bool = False,
                         **kwargs) -> typing.Tuple[typing.Any, typing.Optional[dict]]:
         assert self.ws_connect is not None
 
-        if without_response:
-            try:
-                await self.ws_connect.send_str(self.json_serialize(data), **kwargs)
-            except ConnectionResetError as e:
-                error = errors.ServerError(utils.get_exc_message(e)).with_traceback()
-                self._notify_all_about_error(error)
-                raise error
+        if self._batch_window is not None and not kwargs and data.__class__ is dict and 'method' in data:
+            return await self._send_json_in_window(data)
+
+        return await self._send_json(data, without_response=without_response, **kwargs)
 
+    async def _send_json(self,
+                         data: typing.Any, *,
+                         without_response: bool = False,
+                         **kwargs) -> typing.Tuple[typing.Any, typing.Optional[dict]]:
+        if without_response:
+            await self._send_data(data, **kwargs)
             return None, None
 
         request_ids = self._get_ids_from_json(data)
-        future: asyncio.Future = asyncio.Future()
+
+        if not request_ids:
+            # Nothing will be waited for (e.g. a batch of notifications), so a future isn't needed.
+            await self._send_data(data, **kwargs)
+            return None, None
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
 
         for request_id in request_ids:
             self._pending[request_id] = future
 
-        try:
-            await self.ws_connect.send_str(self.json_serialize(data), **kwargs)
-        except ConnectionResetError as e:
-            error = errors.ServerError(utils.get_exc_message(e)).with_traceback()
-            self._notify_all_about_error(error)
-            raise error
+        await self._send_data(data, **kwargs)
 
-        if not request_ids:
-            return None, None
+        cancel_timeout = None
 
         if self._timeout is not None:
-            future = asyncio.wait_for(future, timeout=self._timeout)  # type: ignore
+            cancel_timeout = self._add_timeout(loop, request_ids, future)
 
-        result = await future
+        try:
+            result = await future
+        except asyncio.CancelledError:
+            self._drop_pending(request_ids, future)
+            raise
+        finally:
+            if cancel_timeout is not None:
+                cancel_timeout()
 
         return result, None
 
+    async def _send_json_in_window(self, data: dict) -> typing.Tuple[typing.Any, typing.Optional[dict]]:
+        loop = asyncio.get_running_loop()
+        send_window = self._send_window
+
+        if send_window is None:
+            send_window = self._send_window = []
+            task = loop.create_task(self._flush_send_window())
+            # To avoid a task disappearing mid execution:
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+
+        # A future of a notification is resolved when the batch is sent.
+        future = loop.create_future()
+        send_window.append((data, future,))
+        return await future, None
+
+    async def _flush_send_window(self) -> None:
+        await asyncio.sleep(self._batch_window)  # type: ignore
+
+        send_window = self._send_window
+        self._send_window = None
+
+        if not send_window:
+            return
+
+        try:
+            if len(send_window) == 1:
+                data = send_window[0][0]
+                json_responses, _ = await self._send_json(data, without_response=data.get('id') is None)
+            else:
+                json_responses, _ = await self._send_json([data for data, _ in send_window])
+        except asyncio.CancelledError:
+            for _, future in send_window:
+                future.cancel()
+
+            raise
+        except Exception as e:
+            for _, future in send_window:
+                if not future.done():
+                    future.set_exception(e)
+
+            return
+
+        if json_responses.__class__ is dict:
+            json_responses = [json_responses]
+
+        # A response without an id (e.g. an error of parsing) is related to all requests.
+        json_responses_by_id = {
+            json_response.get('id'): json_response
+            for json_response in json_responses or ()
+            if json_response.__class__ is dict and json_response.get('id').__class__ in (int, str, type(None),)
+        }
+        common_json_response = json_responses_by_id.get(None)
+
+        for data, future in send_window:
+            if future.done():
+                continue
+
+            request_id = data.get('id')
+
+            if request_id is None:
+                future.set_result(None)
+                continue
+
+            json_response = json_responses_by_id.get(request_id, common_json_response)
+
+            if json_response is None:
+                future.set_exception(errors.ServerError('The response was not found.'))
+            else:
+                future.set_result(json_response)
+
+    def _add_timeout(self,
+                     loop: asyncio.AbstractEventLoop,
+                     request_ids: typing.Sequence[typedefs.JsonRpcIdType],
+                     future: asyncio.Future) -> typing.Callable[[], typing.Any]:
+        # It returns a function that cancels the timeout.
+        # A timer is cheaper than a wrapper task per request of `asyncio.wait_for`.
+        timeout_resolution = self.timeout_resolution
+
+        if timeout_resolution is None:
+            timer = loop.call_later(self._timeout, self._notify_about_timeout, request_ids, future)  # type: ignore
+            return timer.cancel
+
+        # Deadlines are rounded up to `timeout_resolution`, so requests sent at close times share one timer.
+        tick = math.ceil((loop.time() + self._timeout) / timeout_resolution)  # type: ignore
+        timeout_bucket = self._timeout_buckets.get(tick)
+
+        if timeout_bucket is None:
+            timeout_bucket = self._timeout_buckets[tick] = {}
+            loop.call_at(tick * timeout_resolution, self._notify_about_timeouts, tick)
+
+        timeout_bucket[future] = request_ids
+        return partial(timeout_bucket.pop, future, None)
+
+    async def _send_data(self, data: typing.Any, **kwargs) -> None:
+        assert self.ws_connect is not None
+
+        try:
+            if self._use_binary_frames:
+                await self._send_bytes(self._json_serialize_bytes(data), **kwargs)
+            elif self._send_frame is not None and self._can_serialize_bytes():
+                # Serialized bytes are sent as a text frame without decoding them into `str` and encoding back.
+                await self._send_frame(self.json_serialize_bytes(data), http_websocket.WSMsgType.TEXT, **kwargs)
+            else:
+                await self._send_str(self.json_serialize(data), **kwargs)
+        except ConnectionResetError as e:
+            error = errors.ServerError(utils.get_exc_message(e)).with_traceback()
+            self._notify_all_about_error(error)
+            raise error
+
     @staticmethod
     def _get_ids_from_json(data: typing.Any) -> typing.Tuple[typedefs.JsonRpcIdType, ...]:
         if not data:
             return ()
 
-        if isinstance(data, typing.Mapping) and data.get('id') is not None:
-            return (
-                data['id'],
-            )
+        # Concrete types are checked first, because checks of abstract types are much slower.
+        if isinstance(data, (dict, typing.Mapping)):
+            request_id = data.get('id')
+            return () if request_id is None else (request_id,)
 
-        if isinstance(data, typing.Sequence):
-            return tuple(
-                item['id']
+        if not isinstance(data, (list, tuple, typing.Sequence)):
+            return ()
+
+        try:
+            # Usually all requests of a batch have ids, so items are not checked one by one.
+            request_ids = tuple([item['id'] for item in data])
+        except (KeyError, TypeError):
+            # Each id is read once.
+            request_ids = tuple([
+                item.get('id')
                 for item in data
-                if isinstance(item, typing.Mapping) and item.get('id') is not None
-            )
+                if isinstance(item, (dict, typing.Mapping))
+            ])
 
-        return ()
+        if None not in request_ids:
+            return request_ids
+
+        # Notifications are mixed with requests.
+        return tuple([request_id for request_id in request_ids if request_id is not None])
 
     async def _handle_ws_messages(self) -> None:
         assert self.ws_connect is not None
 
+        ws_msgs: typing.AsyncIterator[http_websocket.WSMessage]
+
+        if self._timeout_for_data_receiving is None:
+            # The iterator of `aiohttp` stops on closing messages itself.
+            ws_msgs = self.ws_connect  # type: ignore
+        else:
+            ws_msgs = self._receive_ws_messages(self._timeout_for_data_receiving)
+
+        data_ws_msg_types = DATA_WS_MSG_TYPES
+        handle_single_ws_message = self._handle_single_ws_message
+        load_ws_message = self._load_ws_message
+        resolve_pending_response = self._resolve_pending_response
+        add_background_task = self._background_tasks.add
+        discard_background_task = self._background_tasks.discard
+        large_message_size = self._large_message_size
+
+        try:
+            async for ws_msg in ws_msgs:
+                if ws_msg.type in data_ws_msg_types:
+                    if large_message_size is not None and len(ws_msg.data) >= large_message_size:
+                        # A large message is decoded in a task, so the loop doesn't wait for it.
+                        task = asyncio.create_task(handle_single_ws_message(ws_msg))
+                    else:
+                        json_response = load_ws_message(ws_msg)
+
+                        # Responses to pending calls are resolved in place,
+                        # a task is created only for messages that can wait for handlers.
+                        if not json_response or resolve_pending_response(json_response):
+                            continue
+
+                        task = asyncio.create_task(handle_single_ws_message(ws_msg, json_response))
+
+                    # To avoid a task disappearing mid execution:
+                    add_background_task(task)
+                    task.add_done_callback(discard_background_task)
+
+                if self._is_closed:
+                    break
+        except asyncio.CancelledError as e:
+            error = errors.InternalError(utils.get_exc_message(e)).with_traceback()
+            self._notify_all_about_error(error)
+            raise
+
+    async def _receive_ws_messages(self, timeout: float) -> typing.AsyncIterator[http_websocket.WSMessage]:
+        assert self.ws_connect is not None
+
+        receive = self.ws_connect.receive
+
         while True:
             try:
-                ws_msg: http_websocket.WSMessage = await self.ws_connect.receive(
-                    timeout=self._timeout_for_data_receiving,
-                )
+                ws_msg: http_websocket.WSMessage = await receive(timeout=timeout)
             except asyncio.TimeoutError:
                 if self._is_closed:
                     break
                 else:
                     continue
 
-            if ws_msg.type in (
-                http_websocket.WSMsgType.CLOSE,
-                http_websocket.WSMsgType.CLOSING,
-                http_websocket.WSMsgType.CLOSED,
-            ):
+            if ws_msg.type in CLOSING_WS_MSG_TYPES:
                 break
 
-            if ws_msg.type != http_websocket.WSMsgType.TEXT:
-                continue
-
-            try:
-                task = asyncio.create_task(self._handle_single_ws_message(ws_msg))
-            except asyncio.CancelledError as e:
-                error = errors.InternalError(utils.get_exc_message(e)).with_traceback()
-                self._notify_all_about_error(error)
-                break
-            except Exception:
-                logger.warning('Can\'t process WS message.', exc_info=True)
-            else:
-                # To avoid a task disappearing mid execution:
-                self._background_tasks.add(task)
-                task.add_done_callback(self._background_tasks.discard)
-
-            if self._is_closed:
-                break
+            yield ws_msg
 
     async def _check_ws_connection(self) -> None:
         assert self.ws_connect is not None
@@ -212,24 +456,62 @@ class WsJsonRpcClient(BaseJsonRpcClient):
         except asyncio.CancelledError:
             pass
 
-    async def _handle_single_ws_message(self, ws_msg: http_websocket.WSMessage) -> None:
-        if ws_msg.type != http_websocket.WSMsgType.text:
-            return
-
+    def _load_ws_message(self, ws_msg: http_websocket.WSMessage) -> typing.Any:
         try:
-            json_response = self.json_deserialize(ws_msg.data)
+            return self.json_deserialize(ws_msg.data)
         except Exception:
             logger.warning('Can\'t parse json.', exc_info=True)
-            return
+            return None
+
+    def _resolve_pending_response(self, json_response: typing.Any) -> bool:
+        # Returns `True` if the response was related to pending calls.
+        if json_response.__class__ is dict:
+            if 'method' in json_response:
+                return False
+
+            response_id = json_response.get('id')
+
+            # Other types of ids (e.g. lists from a broken server) can be unhashable.
+            if response_id.__class__ is not int and response_id.__class__ is not str:
+                return False
+
+            # One `pop` instead of a check and a `pop` in `_notify_about_result`.
+            future = self._pending.pop(response_id, None)
+
+            if future is None:
+                return False
+
+            if not future.done():
+                future.set_result(json_response)
+
+            return True
+
+        if json_response.__class__ is list:
+            first_item = json_response[0]
+
+            if first_item.__class__ is dict and 'method' not in first_item:
+                return self._notify_about_results(json_response)
+
+        return False
+
+    async def _handle_single_ws_message(self,
+                                        ws_msg: http_websocket.WSMessage,
+                                        json_response: typing.Any = constants.NOTHING) -> None:
+        # The receiving loop has already checked the type of the message.
+        if json_response is constants.NOTHING:
+            # Only large messages aren't loaded by the receiving loop (see `large_message_size`).
+            loop = asyncio.get_running_loop()
+            json_response = await loop.run_in_executor(None, self._load_ws_message, ws_msg)
 
         if not json_response:
             return
 
-        if isinstance(json_response, typing.Mapping):
+        # JSON decoders return only concrete types.
+        if isinstance(json_response, dict):
             await self._handle_single_json_response(json_response, ws_msg=ws_msg)
             return
 
-        if isinstance(json_response, typing.Sequence):
+        if isinstance(json_response, list):
             await self._handle_json_responses(json_response, ws_msg=ws_msg)
             return
 
@@ -255,47 +537,98 @@ class WsJsonRpcClient(BaseJsonRpcClient):
             )
 
     async def _handle_json_responses(self, json_responses: typing.Sequence, *, ws_msg: web_ws.WSMessage) -> None:
-        if isinstance(json_responses[0], typing.Mapping) and 'method' in json_responses[0]:
+        if isinstance(json_responses[0], dict) and 'method' in json_responses[0]:
             if self._json_request_handler is not None:
                 await self._json_request_handler(ws_connect=self.ws_connect, ws_msg=ws_msg)
-        else:
-            response_ids = self._get_ids_from_json(json_responses)
-
-            if response_ids:
-                self._notify_about_results(response_ids, json_responses)
-            elif self._unprocessed_json_response_handler is not None:
-                self._unprocessed_json_response_handler(
-                    ws_connect=self.ws_connect,
-                    ws_msg=ws_msg,
-                    json_response=json_responses,
-                )
+        elif not self._notify_about_results(json_responses) and self._unprocessed_json_response_handler is not None:
+            self._unprocessed_json_response_handler(
+                ws_connect=self.ws_connect,
+                ws_msg=ws_msg,
+                json_response=json_responses,
+            )
 
     def _notify_all_about_error(self, error: Exception) -> None:
-        for future in self._pending.values():
-            try:
+        pending = self._pending
+
+        if not pending:
+            return
+
+        # Ids of a batch share one future, so each future is resolved once without catching `InvalidStateError`.
+        futures = set(pending.values())
+        pending.clear()
+
+        for future in futures:
+            if not future.done():
                 future.set_exception(error)
-            except asyncio.InvalidStateError:
-                pass
 
-        self._pending.clear()
+    def _notify_about_timeouts(self, tick: int) -> None:
+        timeout_bucket = self._timeout_buckets.pop(tick, None)
+
+        if not timeout_bucket:
+            return
+
+        for future, request_ids in tuple(timeout_bucket.items()):
+            self._notify_about_timeout(request_ids, future)
+
+    def _notify_about_timeout(self,
+                              request_ids: typing.Sequence[typedefs.JsonRpcIdType],
+                              future: asyncio.Future) -> None:
+        self._drop_pending(request_ids, future)
+
+        if not future.done():
+            future.set_exception(asyncio.TimeoutError())
+
+    def _drop_pending(self, request_ids: typing.Sequence[typedefs.JsonRpcIdType], future: asyncio.Future) -> None:
+        pending = self._pending
+
+        for request_id in request_ids:
+            if pending.get(request_id) is future:
+                del pending[request_id]
 
     def _notify_about_result(self, response_id: typedefs.JsonRpcIdType, json_response: typing.Mapping) -> None:
         future = self._pending.pop(response_id, None)
 
-        if future is not None:
+        if future is not None and not future.done():
             future.set_result(json_response)
 
-    def _notify_about_results(self,
-                              response_ids: typing.Sequence[typedefs.JsonRpcIdType],
-                              json_response: typing.Sequence) -> None:
-        is_processed = False
+    def _notify_about_results(self, json_responses: typing.Sequence) -> bool:
+        # Ids are collected at once, then futures are resolved in one pass over them.
+        # Returns `False` if the responses don't have ids.
+        if not self._pending:
+            # Nothing is waiting, so only ids are checked.
+            return any(
+                isinstance(json_response, dict) and json_response.get('id') is not None
+                for json_response in json_responses
+            )
+
+        try:
+            # Items of a batch response are dicts with ids, so they are not checked one by one.
+            response_ids = [json_response['id'] for json_response in json_responses]
+        except (KeyError, TypeError):
+            response_ids = [
+                json_response.get('id')
+                for json_response in json_responses
+                if isinstance(json_response, dict)
+            ]
+
+        has_ids = False
+        future = None
+        pop_future = self._pending.pop
 
         for response_id in response_ids:
-            future = self._pending.pop(response_id, None)
+            # Other types of ids (e.g. lists from a broken server) can be unhashable.
+            if response_id.__class__ is not int and response_id.__class__ is not str:
+                continue
+
+            has_ids = True
+            # We suppose that a batch result has the same ids that we sent.
+            # And these ids have the same future, so the rest of them are only dropped.
+            if future is None:
+                future = pop_future(response_id, None)
+            else:
+                pop_future(response_id, None)
 
-            if future is not None and not is_processed:
-                # We suppose that a batch result has the same ids that we sent.
-                # And these ids have the same future.
+        if future is not None and not future.done():
+            future.set_result(json_responses)
 
-                future.set_result(json_response)
-                is_processed = True
+        return has_ids
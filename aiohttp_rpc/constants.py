@@ -1,3 +1,7 @@
+import sys
+import typing
+
+
 __all__ = (
     'NOTHING',
     'VERSION_2_0',
@@ -11,3 +15,6 @@ class NOTHING:
 VERSION_2_0 = '2.0'
 
 JSON_PRIMITIVE_TYPES = (str, int, float, bool, type(None),)
+
+# `slots` is supported by `dataclass` since Python 3.10.
+DATACLASS_SLOTS_OPTIONS: typing.Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
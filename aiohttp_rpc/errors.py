@@ -1,5 +1,6 @@
 import sys
 import traceback
+import types
 import typing
 
 
@@ -12,6 +13,7 @@ __all__ = (
     'InvalidParams',
     'InternalError',
     'DEFAULT_KNOWN_ERRORS',
+    'DEFAULT_ERROR_MAP',
 )
 
 
@@ -99,3 +101,8 @@ DEFAULT_KNOWN_ERRORS = frozenset({
     InvalidParams,
     InternalError,
 })
+
+DEFAULT_ERROR_MAP: typing.Mapping[int, typing.Type[JsonRpcError]] = types.MappingProxyType({
+    error.code: error
+    for error in DEFAULT_KNOWN_ERRORS
+})
@@ -42,6 +42,10 @@ async def exception_middleware(request: protocol.JsonRpcRequest, handler: typing
 
 
 async def logging_middleware(request: protocol.JsonRpcRequest, handler: typing.Callable) -> protocol.JsonRpcResponse:
+    if not logger.isEnabledFor(logging.INFO):
+        # Nothing would be logged, so requests and responses aren't dumped.
+        return await handler(request)
+
     raw_request = request.dump()
 
     logger.info(
@@ -54,7 +58,7 @@ async def logging_middleware(request: protocol.JsonRpcRequest, handler: typing.C
 
     response = await handler(request)
 
-    raw_response = request.dump()
+    raw_response = response.dump()
 
     logger.info(
         'RpcResponse id="%s" method="%s" params="%s" result="%s" error="%s"',
@@ -63,7 +67,7 @@ async def logging_middleware(request: protocol.JsonRpcRequest, handler: typing.C
         raw_request.get('params', ''),
         raw_response.get('result', ''),
         raw_response.get('error', ''),
-        extra={'request': raw_response, 'response': raw_response},
+        extra={'request': raw_request, 'response': raw_response},
     )
 
     return response
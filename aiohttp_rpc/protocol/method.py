@@ -3,7 +3,7 @@ import asyncio
 import inspect
 import typing
 
-from .. import errors, utils
+from .. import constants, errors, utils
 
 
 __all__ = (
@@ -42,6 +42,8 @@ class JsonRpcMethod(BaseJsonRpcMethod):
     is_class: bool
     _add_extra_args: bool
     _prepare_result: typing.Optional[typing.Callable]
+    _signature: inspect.Signature
+    _positional_range: typing.Optional[typing.Tuple[int, int]]
 
     def __init__(self,
                  func: typing.Callable, *,
@@ -54,11 +56,13 @@ class JsonRpcMethod(BaseJsonRpcMethod):
         self.name = name if name is not None else func.__name__
         self.doc = self.func.__doc__
 
-        self._add_extra_args = add_extra_args
         self._prepare_result = prepare_result
 
         self._inspect_func()
 
+        # Extra args are passed only by names of arguments, so methods without them can skip merging.
+        self._add_extra_args = add_extra_args and bool(self.supported_args or self.supported_kwargs)
+
     async def __call__(self,
                        args: typing.Sequence,
                        kwargs: typing.Mapping,
@@ -82,16 +86,40 @@ class JsonRpcMethod(BaseJsonRpcMethod):
         self.is_class = inspect.isclass(self.func)
         func = self.func.__init__ if self.is_class else self._unwrap_func(self.func)  # type: ignore
 
-        argspec = inspect.getfullargspec(func)
-
-        if self.is_class or inspect.ismethod(func):
-            self.supported_args = tuple(argspec.args[1:])
-        else:
-            self.supported_args = tuple(argspec.args)
-
-        self.supported_kwargs = tuple(argspec.kwonlyargs)
         self.is_coroutine = asyncio.iscoroutinefunction(func)
 
+        # The signature is built once, it is used to check arguments of each call.
+        # It also follows `__wrapped__` and skips `self` of bound methods.
+        self._signature = inspect.signature(self.func.__init__ if self.is_class else self.func)  # type: ignore
+        parameters = tuple(self._signature.parameters.values())
+
+        if self.is_class:
+            parameters = parameters[1:]  # `self` of `__init__`
+
+        self.supported_args = tuple([
+            parameter.name
+            for parameter in parameters
+            if parameter.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        ])
+        self.supported_kwargs = tuple([
+            parameter.name
+            for parameter in parameters
+            if parameter.kind is inspect.Parameter.KEYWORD_ONLY
+        ])
+        self._positional_range = self._get_positional_range()
+
+    def _get_positional_range(self) -> typing.Optional[typing.Tuple[int, int]]:
+        # Calls of functions with only positional parameters can be checked by the number of arguments.
+        parameters = tuple(self._signature.parameters.values())
+        positional_kinds = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD,)
+
+        if not all(parameter.kind in positional_kinds for parameter in parameters):
+            return None
+
+        offset = 1 if self.is_class else 0  # `self` of `__init__`
+        min_count = sum(parameter.default is inspect.Parameter.empty for parameter in parameters)
+        return min_count - offset, len(parameters) - offset
+
     @staticmethod
     def _unwrap_func(func: typing.Callable) -> typing.Callable:
         i = 0
@@ -114,7 +142,7 @@ class JsonRpcMethod(BaseJsonRpcMethod):
 
         new_args = self._add_extra_args_in_args(args, extra_args)
 
-        if (len(new_args) - len(args)) == len(extra_args):
+        if not self.supported_kwargs or (len(new_args) - len(args)) == len(extra_args):
             return new_args, kwargs
 
         new_kwargs = self._add_extra_kwargs_in_args(kwargs, extra_args)
@@ -123,13 +151,17 @@ class JsonRpcMethod(BaseJsonRpcMethod):
     def _add_extra_args_in_args(self, args: typing.Sequence, extra_args: typing.Mapping) -> typing.Sequence:
         if self.supported_args:
             new_args = []
+            nothing = constants.NOTHING
 
             for supported_arg in self.supported_args:
-                if supported_arg not in extra_args:
+                # One lookup instead of a check and a getting.
+                value = extra_args.get(supported_arg, nothing)
+
+                if value is nothing:
                     # We add extra args only in the begin.
                     break
 
-                new_args.append(extra_args[supported_arg])
+                new_args.append(value)
 
             if new_args:
                 new_args.extend(args)
@@ -140,10 +172,14 @@ class JsonRpcMethod(BaseJsonRpcMethod):
     def _add_extra_kwargs_in_args(self, kwargs: typing.Mapping, extra_args: typing.Mapping) -> typing.Mapping:
         if extra_args:
             new_kwargs = {}
+            nothing = constants.NOTHING
+
+            # Supported kwargs are looked up in the dict instead of searching each extra arg in the tuple.
+            for supported_kwarg in self.supported_kwargs:
+                value = extra_args.get(supported_kwarg, nothing)
 
-            for extra_arg, value in extra_args.items():
-                if extra_arg in self.supported_kwargs:
-                    new_kwargs[extra_arg] = value
+                if value is not nothing:
+                    new_kwargs[supported_kwarg] = value
 
             if new_kwargs:
                 new_kwargs.update(kwargs)
@@ -152,10 +188,16 @@ class JsonRpcMethod(BaseJsonRpcMethod):
         return kwargs
 
     def _check_func_signature(self, args: typing.Sequence, kwargs: typing.Mapping) -> None:
+        positional_range = self._positional_range
+
+        if positional_range is not None and not kwargs and positional_range[0] <= len(args) <= positional_range[1]:
+            return
+
+        # `bind` also makes a message of the error.
         try:
             if self.is_class:
-                inspect.signature(self.func.__init__).bind(None, *args, **kwargs)  # type: ignore
+                self._signature.bind(None, *args, **kwargs)
             else:
-                inspect.signature(self.func).bind(*args, **kwargs)
+                self._signature.bind(*args, **kwargs)
         except TypeError as e:
             raise errors.InvalidParams(utils.get_exc_message(e)) from e
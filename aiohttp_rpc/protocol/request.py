@@ -10,7 +10,7 @@ __all__ = (
 )
 
 
-@dataclass
+@dataclass(**constants.DATACLASS_SLOTS_OPTIONS)
 class JsonRpcRequest:
     method_name: str
     # If `id` is `None` then `JsonRpcRequest` is a notification.
@@ -60,13 +60,11 @@ class JsonRpcRequest:
         )
 
     def dump(self) -> typing.Mapping[str, typing.Any]:
-        data: typing.Dict[str, typing.Any] = {
-            'method': self.method_name,
-            'jsonrpc': self.jsonrpc,
-        }
-
-        if not self.is_notification:
-            data['id'] = self.id
+        # The property `is_notification` isn't used to skip a call in the hot path.
+        if self.id is None:
+            data: typing.Dict[str, typing.Any] = {'method': self.method_name, 'jsonrpc': self.jsonrpc}
+        else:
+            data = {'method': self.method_name, 'jsonrpc': self.jsonrpc, 'id': self.id}
 
         if self.params is not constants.NOTHING:
             data['params'] = self.params
@@ -75,7 +73,7 @@ class JsonRpcRequest:
 
     @staticmethod
     def _validate_json_request(data: typing.Any) -> None:
-        if not isinstance(data, typing.Mapping):
+        if not isinstance(data, (dict, typing.Mapping)):
             raise errors.InvalidRequest('The request must be of the dict type.')
 
         if not ({'method', 'jsonrpc'}) <= data.keys():
@@ -84,23 +82,26 @@ class JsonRpcRequest:
         utils.validate_jsonrpc(data['jsonrpc'])
 
 
-@dataclass
+@dataclass(**constants.DATACLASS_SLOTS_OPTIONS)
 class JsonRpcBatchRequest:
     requests: typing.Tuple[JsonRpcRequest, ...] = field(default_factory=tuple)
 
     @property
     def is_notification(self) -> bool:
-        return all(request.is_notification for request in self.requests)
+        # It is checked for each request of a batch, so the property isn't called here.
+        return all(request.id is None for request in self.requests)
 
     @classmethod
     def load(cls, data: typing.Any, **kwargs) -> 'JsonRpcBatchRequest':
-        if not isinstance(data, typing.Sequence):
+        if not isinstance(data, (list, tuple, typing.Sequence)):
             raise errors.InvalidRequest('A batch request must be of the list type.')
 
-        return cls(requests=tuple(
-            JsonRpcRequest.load(item, **kwargs)
+        load = JsonRpcRequest.load
+
+        return cls(requests=tuple([
+            load(item, **kwargs)
             for item in data
-        ))
+        ]))
 
     def dump(self) -> typing.Tuple[typing.Mapping[str, typing.Any], ...]:
-        return tuple(request.dump() for request in self.requests)
+        return tuple([request.dump() for request in self.requests])
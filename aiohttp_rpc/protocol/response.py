@@ -12,7 +12,7 @@ __all__ = (
 )
 
 
-@dataclass
+@dataclass(**constants.DATACLASS_SLOTS_OPTIONS)
 class JsonRpcResponse:
     id: typing.Optional[typedefs.JsonRpcIdType] = None
     jsonrpc: str = constants.VERSION_2_0
@@ -28,49 +28,59 @@ class JsonRpcResponse:
     def load(cls,
              data: typing.Any, *,
              error_map: typing.Optional[typing.Mapping] = None, **kwargs) -> 'JsonRpcResponse':
+        return cls._load(data, error_map, kwargs)
+
+    @classmethod
+    def _load(cls,
+              data: typing.Any,
+              error_map: typing.Optional[typing.Mapping],
+              kwargs: typing.Mapping) -> 'JsonRpcResponse':
+        # Arguments are positional, so a batch can share them without repacking for each item.
         cls._validate_json_response(data)
 
         response = cls(
             id=data.get('id'),
-            jsonrpc=data.get('jsonrpc', constants.VERSION_2_0),
+            jsonrpc=constants.VERSION_2_0,  # The version has already been validated.
             result=data.get('result'),
             **kwargs,
         )
 
         if 'error' in data:
-            cls._add_error(response, data['error'], error_map=error_map)
+            cls._add_error(response, data['error'], error_map)
 
         return response
 
     def dump(self) -> typing.Mapping[str, typing.Any]:
-        data: typing.Dict[str, typing.Any] = {
-            'id': self.id,
-            'jsonrpc': self.jsonrpc,
-        }
+        # Each branch builds the whole dict with one literal.
+        error = self.error
 
-        if self.error is None:
-            data['result'] = self.result
-        else:
-            data['error'] = {'code': self.error.code, 'message': self.error.message}
+        if error is None:
+            return {'id': self.id, 'jsonrpc': self.jsonrpc, 'result': self.result}
 
-            if self.error.data is not None:
-                data['error']['data'] = self.error.data
+        if error.data is None:
+            error_data = {'code': error.code, 'message': error.message}
+        else:
+            error_data = {'code': error.code, 'message': error.message, 'data': error.data}
 
-        return data
+        return {'id': self.id, 'jsonrpc': self.jsonrpc, 'error': error_data}
 
     @staticmethod
     def _validate_json_response(data: typing.Any) -> None:
-        if not isinstance(data, typing.Mapping):
+        if data.__class__ is not dict and not isinstance(data, typing.Mapping):
             raise errors.InvalidRequest
 
-        utils.validate_jsonrpc(data.get('jsonrpc'))
+        jsonrpc = data.get('jsonrpc')
+
+        if jsonrpc != constants.VERSION_2_0:
+            # It raises an error with a message.
+            utils.validate_jsonrpc(jsonrpc)
 
         if 'result' not in data and 'error' not in data:
             raise errors.InvalidRequest('"result" or "error" not found in data.', data={'raw_response': data})
 
     @staticmethod
     def _add_error(response: 'JsonRpcResponse',
-                   error: typing.Any, *,
+                   error: typing.Any,
                    error_map: typing.Optional[typing.Mapping] = None) -> None:
         if not isinstance(error, typing.Mapping):
             raise errors.InvalidRequest
@@ -90,7 +100,7 @@ class JsonRpcResponse:
         )
 
 
-@dataclass
+@dataclass(**constants.DATACLASS_SLOTS_OPTIONS)
 class JsonRpcBatchResponse:
     responses: typing.Tuple[JsonRpcResponse, ...] = field(default_factory=tuple)
 
@@ -99,35 +109,48 @@ class JsonRpcBatchResponse:
              data: typing.Any, *,
              error_map: typing.Optional[typing.Mapping] = None,
              **kwargs) -> 'JsonRpcBatchResponse':
-        if not isinstance(data, typing.Sequence):
+        if not isinstance(data, (list, tuple, typing.Sequence)):
             raise errors.InvalidRequest('A batch request must be of the list type.')
 
-        return cls(responses=tuple(
-            JsonRpcResponse.load(item, error_map=error_map, **kwargs)
+        load = JsonRpcResponse._load
+
+        return cls(responses=tuple([
+            load(item, error_map, kwargs)
             for item in data
-        ))
+        ]))
 
     def dump(self) -> typing.Tuple[typing.Mapping[str, typing.Any], ...]:
-        return tuple(response.dump() for response in self.responses)
+        return tuple([response.dump() for response in self.responses])
 
 
-@dataclass
-class JsonRpcUnlinkedResults:
-    results: typing.MutableSequence = field(default_factory=list)
+class _JsonRpcResults:
+    # A batch response can allocate such containers, so they don't have `__dict__`.
+    __slots__ = ('results',)
 
-    def __bool__(self) -> bool:
-        return len(self.results) > 0
+    results: typing.MutableSequence
 
-    def add(self, value: typing.Any) -> None:
-        self.results.append(value)
+    def __init__(self, results: typing.Optional[typing.MutableSequence] = None) -> None:
+        self.results = [] if results is None else results
 
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(results={self.results!r})'
 
-@dataclass
-class JsonRpcDuplicatedResults:
-    results: typing.MutableSequence = field(default_factory=list)
+    def __eq__(self, other: typing.Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return self.results == other.results
 
     def __bool__(self) -> bool:
         return len(self.results) > 0
 
     def add(self, value: typing.Any) -> None:
         self.results.append(value)
+
+
+class JsonRpcUnlinkedResults(_JsonRpcResults):
+    __slots__ = ()
+
+
+class JsonRpcDuplicatedResults(_JsonRpcResults):
+    __slots__ = ()
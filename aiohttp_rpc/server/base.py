@@ -15,10 +15,12 @@ class BaseJsonRpcServer(abc.ABC):
     methods: typing.MutableMapping[str, protocol.BaseJsonRpcMethod]
     middlewares: typing.Sequence[typing.Callable]
     json_serialize: typedefs.UnboundJSONEncoderType
+    json_deserialize: typedefs.UnboundJSONDecoderType
     _middleware_chain: typing.ClassVar[typedefs.UnboundSingleRequestProcessorType]
 
     def __init__(self, *,
                  json_serialize: typedefs.JSONEncoderType = utils.json_serialize,
+                 json_deserialize: typedefs.JSONDecoderType = utils.json_deserialize,
                  middlewares: typing.Sequence = (),
                  methods: typing.Optional[typing.MutableMapping[str, protocol.BaseJsonRpcMethod]] = None) -> None:
         if methods is None:
@@ -33,6 +35,7 @@ class BaseJsonRpcServer(abc.ABC):
         self._load_middlewares()
 
         self.json_serialize = json_serialize  # type: ignore
+        self.json_deserialize = json_deserialize  # type: ignore
 
     def add_method(self,
                    method: typing.Union[typedefs.ServerMethodDescriptionType], *,
@@ -107,46 +110,54 @@ class BaseJsonRpcServer(abc.ABC):
             data: typing.Any, *,
             context: typing.MutableMapping[str, typing.Any],
     ) -> typing.Optional[typing.Union[typing.Mapping, typing.Tuple[typing.Mapping, ...]]]:
-        if isinstance(data, typing.Sequence):
+        # Concrete types are checked first, because checks of abstract types are much slower.
+        if isinstance(data, (list, typing.Sequence)):
             if not data:
                 return protocol.JsonRpcResponse(error=errors.InvalidRequest()).dump()
 
+            process_single_json_request = self._process_single_json_request
             json_responses = await asyncio.gather(
-                *(
-                    self._process_single_json_request(raw_rcp_request, context=context)
+                *[
+                    process_single_json_request(raw_rcp_request, context=context)
                     for raw_rcp_request in data
-                ),
+                ],
                 return_exceptions=True,
             )
 
-            result = tuple(
-                json_response
-                for json_response in self._raise_exception_if_have(json_responses)
-                if json_response is not None  # Skip notifications.
-            )
+            # Exceptions are raised and notifications are skipped in one pass.
+            result = []
+
+            for json_response in json_responses:
+                if json_response is None:  # It is a notification.
+                    continue
+
+                if isinstance(json_response, Exception):
+                    # Use middlewares (`exception_middleware`) to process exceptions.
+                    raise json_response
 
-            return result if result else None
+                result.append(typing.cast(typing.Mapping, json_response))
 
-        if isinstance(data, typing.Mapping):
+            return tuple(result) if result else None
+
+        if isinstance(data, (dict, typing.Mapping)):
             return await self._process_single_json_request(data, context=context)
 
         response = protocol.JsonRpcResponse(error=errors.InvalidRequest('Data must be a dict or an list.'))
         return response.dump()
 
-    @staticmethod
-    def _raise_exception_if_have(values: typing.Iterable) -> typing.Iterable:
-        for i, value in enumerate(values):
-            if isinstance(value, Exception):
-                # Use middlewares (`exception_middleware`) to process exceptions.
-                raise value
-            else:
-                yield value
+    def _json_serialize_bytes(self, data: typing.Any) -> bytes:
+        json_serialize_bytes = utils.get_bytes_serializer(self.json_serialize)
+
+        if json_serialize_bytes is not None:
+            return json_serialize_bytes(data)
+
+        return self.json_serialize(data).encode()
 
     async def _process_single_json_request(self,
                                            json_request: typing.Any, *,
                                            context: typing.MutableMapping[str, typing.Any],
                                            ) -> typing.Optional[typing.Mapping]:
-        if not isinstance(json_request, typing.Mapping):
+        if not isinstance(json_request, (dict, typing.Mapping)):
             return protocol.JsonRpcResponse(error=errors.InvalidRequest('Data must be a dict.')).dump()
 
         try:
@@ -156,7 +167,7 @@ class BaseJsonRpcServer(abc.ABC):
 
         response = await self._middleware_chain(request)
 
-        if response.is_notification:
+        if response.id is None:  # It is a notification.
             return None
 
         return response.dump()
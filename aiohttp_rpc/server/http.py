@@ -1,4 +1,4 @@
-import json
+import typing
 
 from aiohttp import web
 
@@ -18,14 +18,17 @@ class JsonRpcServer(BaseJsonRpcServer):
             raise web.HTTPMethodNotAllowed(method=http_request.method, allowed_methods=('POST',))
 
         try:
-            input_data = await http_request.json()
-        except json.JSONDecodeError as e:
+            input_data = self.json_deserialize(await http_request.read())
+        except ValueError as e:  # `JSONDecodeError` and `UnicodeDecodeError` are subclasses of it.
             response = protocol.JsonRpcResponse(error=errors.ParseError(utils.get_exc_message(e)))
-            return web.json_response(response.dump(), dumps=self.json_serialize)
+            return self._make_json_response(response.dump())
 
         output_data = await self._process_input_data(input_data, context={'http_request': http_request})
 
-        return web.json_response(output_data, dumps=self.json_serialize)
+        return self._make_json_response(output_data)
+
+    def _make_json_response(self, data: typing.Any) -> web.Response:
+        return web.Response(body=self._json_serialize_bytes(data), content_type='application/json')
 
 
 rpc_server = JsonRpcServer(
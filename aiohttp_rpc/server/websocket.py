@@ -1,5 +1,4 @@
 import asyncio
-import json
 import typing
 import weakref
 
@@ -13,21 +12,32 @@ __all__ = (
     'WsJsonRpcServer',
 )
 
+# `send_frame` is available since `aiohttp==3.11`.
+CAN_SEND_FRAMES = hasattr(web_ws.WebSocketResponse, 'send_frame')
+DATA_WS_MSG_TYPES = frozenset((
+    http_websocket.WSMsgType.TEXT,
+    http_websocket.WSMsgType.BINARY,
+))
+
 
 class WsJsonRpcServer(BaseJsonRpcServer):
     rcp_websockets: weakref.WeakSet
+    ws_response_kwargs: typing.Mapping[str, typing.Any]
     _json_response_handler: typing.Optional[typing.Callable] = None
     _background_tasks: typing.Set
 
     def __init__(self,
                  *args,
                  json_response_handler: typing.Optional[typing.Callable] = None,
+                 ws_response_kwargs: typing.Optional[typing.Mapping[str, typing.Any]] = None,
                  **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
         self.rcp_websockets = weakref.WeakSet()
         self._json_response_handler = json_response_handler
         self._background_tasks = set()
+        # E.g. `{'writer_limit': 2 ** 20}` lets bursts of responses be buffered without waiting for draining.
+        self.ws_response_kwargs = {} if ws_response_kwargs is None else ws_response_kwargs
 
     async def handle_http_request(self, http_request: web.Request) -> web.StreamResponse:
         if http_request.method != 'GET' or http_request.headers.get('upgrade', '').lower() != 'websocket':
@@ -46,7 +56,7 @@ class WsJsonRpcServer(BaseJsonRpcServer):
     async def _handle_ws_request(self, http_request: web.Request) -> web_ws.WebSocketResponse:
         from aiohttp_rpc import WsJsonRpcClient
 
-        ws_connect = web_ws.WebSocketResponse()
+        ws_connect = web_ws.WebSocketResponse(**self.ws_response_kwargs)
         await ws_connect.prepare(http_request)
 
         self.rcp_websockets.add(ws_connect)
@@ -55,11 +65,16 @@ class WsJsonRpcServer(BaseJsonRpcServer):
 
         ws_msg: http_websocket.WSMessage
 
+        data_ws_msg_types = DATA_WS_MSG_TYPES
+        handle_ws_message = self._handle_ws_message
+        add_background_task = self._background_tasks.add
+        discard_background_task = self._background_tasks.discard
+
         async for ws_msg in ws_connect:
-            if ws_msg.type != http_websocket.WSMsgType.TEXT:
+            if ws_msg.type not in data_ws_msg_types:
                 continue
 
-            coro = self._handle_ws_message(
+            coro = handle_ws_message(
                 ws_msg=ws_msg,
                 ws_connect=ws_connect,
                 context={
@@ -72,8 +87,8 @@ class WsJsonRpcServer(BaseJsonRpcServer):
             task = asyncio.create_task(coro)
 
             # To avoid a task disappearing mid execution:
-            self._background_tasks.add(task)
-            task.add_done_callback(self._background_tasks.discard)
+            add_background_task(task)
+            task.add_done_callback(discard_background_task)
 
         return ws_connect
 
@@ -84,8 +99,8 @@ class WsJsonRpcServer(BaseJsonRpcServer):
         json_response: typing.Optional[typing.Union[typing.Mapping, typing.Sequence[typing.Mapping]]]
 
         try:
-            input_data = json.loads(ws_msg.data)
-        except json.JSONDecodeError as e:
+            input_data = self.json_deserialize(ws_msg.data)
+        except ValueError as e:  # `JSONDecodeError` and `UnicodeDecodeError` are subclasses of it.
             response = protocol.JsonRpcResponse(error=errors.ParseError(utils.get_exc_message(e)))
             json_response = response.dump()
         else:
@@ -97,4 +112,11 @@ class WsJsonRpcServer(BaseJsonRpcServer):
         if ws_connect.closed:
             raise errors.ServerError('WS is closed.')
 
-        await ws_connect.send_str(self.json_serialize(json_response))
+        # Responses are sent in frames of the same type as requests.
+        if ws_msg.type is http_websocket.WSMsgType.BINARY:
+            await ws_connect.send_bytes(self._json_serialize_bytes(json_response))
+        elif CAN_SEND_FRAMES:
+            # Serialized bytes are sent as a text frame without decoding them into `str` and encoding back.
+            await ws_connect.send_frame(self._json_serialize_bytes(json_response), http_websocket.WSMsgType.TEXT)
+        else:
+            await ws_connect.send_str(self.json_serialize(json_response))
@@ -9,6 +9,8 @@ if typing.TYPE_CHECKING:
 JsonRpcIdType = typing.Union[int, str]
 JSONEncoderType = typing.Callable[[typing.Any], str]
 UnboundJSONEncoderType = typing.Callable[[typing.Any], str]
+JSONDecoderType = typing.Callable[[typing.Any], typing.Any]
+UnboundJSONDecoderType = typing.Callable[[typing.Any], typing.Any]
 SingleRequestProcessorType = typing.Callable[['protocol.JsonRpcRequest'], typing.Awaitable['protocol.JsonRpcResponse']]
 UnboundSingleRequestProcessorType = typing.Callable[
     [typing.Any, 'protocol.JsonRpcRequest'],
@@ -6,16 +6,25 @@ from traceback import format_exception_only
 
 from . import constants, errors
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 if typing.TYPE_CHECKING:
-    from . import protocol  # NOQA
+    from . import protocol, typedefs  # NOQA
 
 
 __all__ = (
     'convert_params_to_args_and_kwargs',
     'parse_args_and_kwargs',
+    'get_random_id',
     'get_exc_message',
     'json_serialize',
+    'json_serialize_bytes',
+    'get_bytes_serializer',
     'collect_batch_result',
+    'collect_batch_result_by_ids',
 )
 
 
@@ -23,6 +32,15 @@ def convert_params_to_args_and_kwargs(params: typing.Any) -> typing.Tuple[typing
     if params is constants.NOTHING:
         return (), {}
 
+    # Decoded params are usually lists or dicts, so they are checked by exact types before `isinstance`.
+    params_type = params.__class__
+
+    if params_type is list:
+        return params, {}
+
+    if params_type is dict:
+        return (), params
+
     if isinstance(params, constants.JSON_PRIMITIVE_TYPES):
         return (params,), {}
 
@@ -71,39 +89,108 @@ def validate_jsonrpc(jsonrpc: typing.Any) -> None:
 
 def collect_batch_result(batch_request: 'protocol.JsonRpcBatchRequest',
                          batch_response: 'protocol.JsonRpcBatchResponse') -> typing.Tuple[typing.Any, ...]:
+    return collect_batch_result_by_ids(
+        tuple([request.id for request in batch_request.requests]),
+        batch_response,
+    )
+
+
+def collect_batch_result_by_ids(request_ids: typing.Sequence[typing.Optional['typedefs.JsonRpcIdType']],
+                                batch_response: 'protocol.JsonRpcBatchResponse') -> typing.Tuple[typing.Any, ...]:
     from . import protocol
 
-    unlinked_results = protocol.JsonRpcUnlinkedResults()
-    responses_map: typing.Dict[typing.Any, typing.Any] = {}
+    # Globals and attributes are bound to locals, because the loops run for each item of a batch.
+    nothing = constants.NOTHING
+    duplicated_results_class = protocol.JsonRpcDuplicatedResults
+
+    # Values are written into the slots of requests, so responses are traversed only once.
+    requests_count = len(request_ids)
+    values: typing.List[typing.Any] = [nothing] * requests_count
+    # The map is built in reverse, so repeated ids keep the first index.
+    request_indexes = dict(zip(reversed(request_ids), range(requests_count - 1, -1, -1)))
+    get_request_index = request_indexes.get
+
+    unlinked_values: typing.List[typing.Any] = []
 
     for response in batch_response.responses:
-        if response.error is None:
-            value = response.result
-        else:
-            value = response.error
+        error = response.error
+        value = response.result if error is None else error
+        response_id = response.id
+
+        if response_id is None:
+            unlinked_values.append(value)
+            continue
+
+        i = get_request_index(response_id)
 
-        if response.id is None:
-            unlinked_results.add(value)
+        if i is None:
             continue
 
-        if response.id in responses_map:
-            if isinstance(responses_map[response.id], protocol.JsonRpcDuplicatedResults):
-                responses_map[response.id].add(value)
-            else:
-                responses_map[response.id] = protocol.JsonRpcDuplicatedResults([
-                    responses_map[response.id],
-                    value,
-                ])
+        current_value = values[i]
+
+        if current_value is nothing:
+            values[i] = value
+        elif current_value.__class__ is duplicated_results_class:
+            current_value.add(value)
         else:
-            responses_map[response.id] = value
+            values[i] = duplicated_results_class([current_value, value])
 
-    return tuple(
-        unlinked_results or None
-        if request.is_notification
-        else responses_map.get(request.id, unlinked_results or None)
-        for request in batch_request.requests
-    )
+    # The container is created only if there are unlinked results.
+    default_value = protocol.JsonRpcUnlinkedResults(unlinked_values) if unlinked_values else None
+
+    if len(request_indexes) == requests_count:
+        # Ids are unique, so values don't need to be copied between requests.
+        return tuple([default_value if value is nothing else value for value in values])
+
+    for i, request_id in enumerate(request_ids):
+        if request_id is not None:
+            # Requests with the same id get the same value.
+            value = values[request_indexes[request_id]]
+        else:
+            value = values[i]
+
+        values[i] = default_value if value is nothing else value
+
+    return tuple(values)
 
 
 json_serialize = partial(json.dumps, default=lambda x: repr(x))
 json_deserialize = json.loads
+
+
+def json_serialize_bytes(data: typing.Any) -> bytes:
+    return json_serialize(data).encode()
+
+
+# `orjson` is opt-in, because its output differs from `json` (e.g. `NaN` becomes `null`, UUIDs become strings,
+# big ints are decoded as floats).
+if orjson is not None:
+    # Dataclasses and datetimes go to `default` as with the stdlib `json`.
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def orjson_serialize_bytes(data: typing.Any) -> bytes:
+        try:
+            return orjson.dumps(data, default=repr, option=_ORJSON_OPTIONS)
+        except TypeError:  # `orjson.JSONEncodeError` is a subclass of it (e.g. for ints out of the 64-bit range).
+            return json_serialize_bytes(data)
+
+    def orjson_serialize(data: typing.Any) -> str:
+        return orjson_serialize_bytes(data).decode()
+
+    orjson_deserialize = orjson.loads
+else:  # pragma: no cover
+    orjson_serialize = None  # type: ignore
+    orjson_serialize_bytes = None  # type: ignore
+    orjson_deserialize = None  # type: ignore
+
+
+def get_bytes_serializer(serialize: typing.Callable[[typing.Any], str],
+                         ) -> typing.Optional[typing.Callable[[typing.Any], bytes]]:
+    # Known serializers have versions that produce bytes without an intermediate `str`.
+    if serialize is orjson_serialize:
+        return orjson_serialize_bytes
+
+    if serialize is json_serialize:
+        return json_serialize_bytes
+
+    return None
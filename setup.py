@@ -23,11 +23,14 @@ def main() -> None:
         install_requires=[
             'aiohttp>=3,<4',
         ],
+        extras_require={
+            'orjson': ['orjson>=3'],
+        },
         license='MIT license',
         description='A simple JSON-RPC for aiohttp',
         long_description=long_description,
         long_description_content_type='text/markdown',
-        python_requires='>=3.7',
+        python_requires='>=3.8',
         packages=packages,
         package_data=package_data,
         classifiers=[
@@ -42,7 +45,6 @@ def main() -> None:
             'Operating System :: OS Independent',
             'Programming Language :: Python',
             'Programming Language :: Python :: 3',
-            'Programming Language :: Python :: 3.7',
             'Programming Language :: Python :: 3.8',
             'Programming Language :: Python :: 3.9',
             'Programming Language :: Python :: 3.10',
@@ -24,6 +24,27 @@ async def test_args(aiohttp_client):
         assert await rpc.call('method', 1) == [1, 2, 1]
 
 
+async def test_positional_args():
+    def method(a, b=2, c=3):
+        return [a, b, c]
+
+    rpc_server = aiohttp_rpc.JsonRpcServer()
+    rpc_server.add_method(method)
+
+    assert await rpc_server.call('method', args=[1]) == [1, 2, 3]
+    assert await rpc_server.call('method', args=[1, 1, 1]) == [1, 1, 1]
+    assert await rpc_server.call('method', args=[1], kwargs={'c': 1}) == [1, 2, 1]
+
+    with pytest.raises(errors.InvalidParams):
+        await rpc_server.call('method')
+
+    with pytest.raises(errors.InvalidParams):
+        await rpc_server.call('method', args=[1, 1, 1, 1])
+
+    with pytest.raises(errors.InvalidParams):
+        await rpc_server.call('method', kwargs={'b': 1})
+
+
 async def test_kwargs(aiohttp_client):
     def method(a=1, *, b=2):
         return [1, a, b]
@@ -160,3 +181,67 @@ async def test_builtin_funcs(aiohttp_client):
     async with aiohttp_rpc.JsonRpcClient('/rpc', session=client) as rpc:
         assert await rpc.sum([1, 2, 3]) == 6
         assert await rpc.zip(['a', 'b'], [1, 2]) == [['a', 1], ['b', 2]]
+
+
+async def test_method_attributes(aiohttp_client):
+    def method(a=1):
+        return a
+
+    rpc_server = aiohttp_rpc.JsonRpcServer()
+    rpc_server.add_method(method)
+
+    client = await utils.make_client(aiohttp_client, rpc_server)
+
+    async with aiohttp_rpc.JsonRpcClient('/rpc', session=client) as rpc:
+        assert rpc.method is rpc.method
+        assert await rpc.method(2) == 2
+
+        rpc.max_cached_methods = 1
+        assert rpc.other_method is not rpc.other_method
+
+        with pytest.raises(AttributeError):
+            rpc.__method__
+
+
+async def test_shared_session(aiohttp_client):
+    def method(a=1):
+        return a
+
+    rpc_server = aiohttp_rpc.JsonRpcServer()
+    rpc_server.add_method(method)
+
+    client = await utils.make_client(aiohttp_client, rpc_server)
+    url = str(client.make_url('/rpc'))
+
+    async with aiohttp_rpc.JsonRpcClient(url, use_shared_session=True) as rpc_1:
+        assert await rpc_1.method(2) == 2
+
+    async with aiohttp_rpc.JsonRpcClient(url, use_shared_session=True) as rpc_2:
+        assert await rpc_2.method(3) == 3
+
+    assert rpc_1.session is rpc_2.session is aiohttp_rpc.get_shared_session()
+    assert not rpc_2.session.closed
+
+    await aiohttp_rpc.close_shared_session()
+    assert rpc_2.session.closed
+
+
+async def test_connector_kwargs(aiohttp_client):
+    def method(a=1):
+        return a
+
+    rpc_server = aiohttp_rpc.JsonRpcServer()
+    rpc_server.add_method(method)
+
+    client = await utils.make_client(aiohttp_client, rpc_server)
+    url = str(client.make_url('/rpc'))
+
+    async with aiohttp_rpc.JsonRpcClient(url, connector_kwargs={'limit_per_host': 5}) as rpc:
+        assert rpc.session.connector.limit_per_host == 5
+        assert await rpc.method(2) == 2
+
+    with pytest.raises(AssertionError):
+        aiohttp_rpc.JsonRpcClient(url, use_shared_session=True, connector_kwargs={'limit': 1})
+
+    with pytest.raises(AssertionError):
+        aiohttp_rpc.JsonRpcClient('/rpc', session=client, connector_kwargs={'limit': 1})
@@ -1,4 +1,10 @@
+import asyncio
+
+import aiohttp
+import pytest
+
 import aiohttp_rpc
+from aiohttp_rpc import errors
 from tests import utils
 
 
@@ -113,3 +119,149 @@ async def test_duplicated_results(aiohttp_client, mocker):
             unlinked_results,
             unlinked_results,
         )
+
+
+async def test_request_ids(aiohttp_client, mocker):
+    def method():
+        return 'ok'
+
+    rpc_server = aiohttp_rpc.JsonRpcServer()
+    rpc_server.add_method(method)
+
+    client = await utils.make_client(aiohttp_client, rpc_server)
+
+    async with aiohttp_rpc.JsonRpcClient('/rpc', session=client) as rpc:
+        send_json = mocker.patch.object(rpc, 'send_json', side_effect=rpc.send_json)
+
+        assert await rpc.call('method') == 'ok'
+        assert await rpc.batch(('method', 'method',)) == ('ok', 'ok',)
+
+        assert send_json.call_args_list[0].args[0]['id'] == 1
+        assert [item['id'] for item in send_json.call_args_list[1].args[0]] == [2, 3]
+
+    async with aiohttp_rpc.JsonRpcClient('/rpc', session=client, id_factory=aiohttp_rpc.utils.get_random_id) as rpc:
+        send_json = mocker.patch.object(rpc, 'send_json', side_effect=rpc.send_json)
+
+        assert await rpc.call('method') == 'ok'
+        assert isinstance(send_json.call_args.args[0]['id'], str)
+
+
+async def test_request_ids_of_requests_made_by_hand(aiohttp_client):
+    def method(a):
+        return a
+
+    rpc_server = aiohttp_rpc.JsonRpcServer()
+    rpc_server.add_method(method)
+
+    client = await utils.make_client(aiohttp_client, rpc_server)
+
+    # Generated ids are ints from 1, so requests made by hand must use other ids (e.g. strings).
+    async with aiohttp_rpc.JsonRpcClient('/rpc', session=client) as rpc:
+        request = aiohttp_rpc.JsonRpcRequest(id='request-1', method_name='method', args=['a'])
+        assert await rpc.batch((request, ('method', 'b'),)) == ('a', 'b',)
+
+    # Or generated ids must be random.
+    async with aiohttp_rpc.JsonRpcClient('/rpc', session=client, id_factory=aiohttp_rpc.utils.get_random_id) as rpc:
+        request = aiohttp_rpc.JsonRpcRequest(id=1, method_name='method', args=['a'])
+        assert await rpc.batch((request, ('method', 'b'),)) == ('a', 'b',)
+
+
+async def test_init_without_super(aiohttp_client):
+    def method(a):
+        return a
+
+    class TestRpcClient(aiohttp_rpc.JsonRpcClient):
+        def __init__(self, url, *, session):
+            self.url = url
+            self.session = session
+            self.request_kwargs = {}
+            self._session_is_outer = True
+
+    rpc_server = aiohttp_rpc.JsonRpcServer()
+    rpc_server.add_method(method)
+
+    client = await utils.make_client(aiohttp_client, rpc_server)
+
+    async with TestRpcClient('/rpc', session=client) as rpc:
+        assert await rpc.method(1) == 1
+        assert await rpc.batch((('method', 2), ('method', 3),)) == (2, 3,)
+        assert rpc._get_next_id() == 4
+
+
+async def test_auto_batch(aiohttp_client, mocker):
+    def method(a):
+        return a
+
+    rpc_server = aiohttp_rpc.JsonRpcServer()
+    rpc_server.add_method(method)
+
+    client = await utils.make_client(aiohttp_client, rpc_server)
+
+    async with aiohttp_rpc.JsonRpcClient('/rpc', session=client, auto_batch=True, max_batch_size=3) as rpc:
+        send_json = mocker.patch.object(rpc, 'send_json', side_effect=rpc.send_json)
+
+        assert await asyncio.gather(*(rpc.call('method', i) for i in range(5))) == [0, 1, 2, 3, 4]
+        assert [len(call.args[0]) for call in send_json.call_args_list] == [3, 2]
+
+        send_json.reset_mock()
+        assert await rpc.method(5) == 5
+        assert send_json.call_args.args[0]['id'] == 6
+
+        with pytest.raises(errors.MethodNotFound):
+            await asyncio.gather(rpc.call('method', 6), rpc.call('unknown_method'))
+
+
+async def test_parallel_batch(aiohttp_client, mocker):
+    def method(a):
+        return a
+
+    rpc_server = aiohttp_rpc.JsonRpcServer()
+    rpc_server.add_method(method)
+
+    client = await utils.make_client(aiohttp_client, rpc_server)
+
+    async with aiohttp_rpc.JsonRpcClient('/rpc', session=client) as rpc:
+        send_json = mocker.patch.object(rpc, 'send_json', side_effect=rpc.send_json)
+
+        result = await rpc.batch([('method', [1]), 'unknown_method', ('method', [3])], parallel=True)
+        assert result[0] == 1
+        assert isinstance(result[1], errors.MethodNotFound)
+        assert result[2] == 3
+        assert send_json.call_count == 3
+
+        batch_request = aiohttp_rpc.JsonRpcBatchRequest(requests=(
+            aiohttp_rpc.JsonRpcRequest(id=1, method_name='method', params=[1]),
+            aiohttp_rpc.JsonRpcRequest(method_name='method', params=[2]),
+        ))
+        assert await rpc.batch(batch_request, parallel=True) == (1, None)
+
+        with pytest.raises(errors.InvalidRequest):
+            await rpc.batch([], parallel=True)
+
+
+async def test_parallel_batch_with_transport_error(aiohttp_client):
+    finished = []
+
+    async def method(a):
+        await asyncio.sleep(0.1)
+        finished.append(a)
+        return a
+
+    class TestRpcClient(aiohttp_rpc.JsonRpcClient):
+        async def direct_call(self, request, **kwargs):
+            if request.method_name == 'broken_method':
+                raise aiohttp.ClientConnectionError
+
+            return await super().direct_call(request, **kwargs)
+
+    rpc_server = aiohttp_rpc.JsonRpcServer()
+    rpc_server.add_method(method)
+
+    client = await utils.make_client(aiohttp_client, rpc_server)
+
+    async with TestRpcClient('/rpc', session=client) as rpc:
+        with pytest.raises(aiohttp.ClientConnectionError):
+            await rpc.batch([('method', [1]), 'broken_method', ('method', [3])], parallel=True)
+
+        # Other requests aren't left running.
+        assert finished == [1, 3]
@@ -1,3 +1,5 @@
+import logging
+
 import aiohttp_rpc
 from tests import utils
 
@@ -19,3 +21,112 @@ async def test_middleware(aiohttp_client):
 
     async with aiohttp_rpc.JsonRpcClient('/rpc', session=client) as rpc:
         assert await rpc.call('my_method') == 'ok!'
+
+
+async def test_custom_headers(aiohttp_client):
+    def method(rpc_request):
+        headers = rpc_request.context['http_request'].headers
+        return [headers['Content-Type'], headers['X-Test']]
+
+    rpc_server = aiohttp_rpc.JsonRpcServer(middlewares=aiohttp_rpc.middlewares.DEFAULT_MIDDLEWARES)
+    rpc_server.add_method(method)
+
+    client = await utils.make_client(aiohttp_client, rpc_server)
+
+    async with aiohttp_rpc.JsonRpcClient('/rpc', session=client) as rpc:
+        request = aiohttp_rpc.JsonRpcRequest(id=1, method_name='method')
+        response = await rpc.direct_call(request, headers={'X-Test': 'value'})
+        assert response.result == ['application/json', 'value']
+
+
+async def test_empty_custom_headers(aiohttp_client):
+    def method(rpc_request):
+        return rpc_request.context['http_request'].headers['Content-Type']
+
+    rpc_server = aiohttp_rpc.JsonRpcServer(middlewares=aiohttp_rpc.middlewares.DEFAULT_MIDDLEWARES)
+    rpc_server.add_method(method)
+
+    client = await utils.make_client(aiohttp_client, rpc_server)
+
+    async with aiohttp_rpc.JsonRpcClient('/rpc', session=client) as rpc:
+        for headers in ({}, None,):
+            request = aiohttp_rpc.JsonRpcRequest(id=1, method_name='method')
+            response = await rpc.direct_call(request, headers=headers)
+            assert response.result == 'application/json'
+
+
+async def test_overridden_direct_call(aiohttp_client):
+    def method():
+        return 'ok'
+
+    class TestRpcClient(aiohttp_rpc.JsonRpcClient):
+        async def direct_call(self, request, **kwargs):
+            return await super().direct_call(request, headers={'X-Test': 'value'}, **kwargs)
+
+    async def test_middleware(request, handler):
+        assert request.context['http_request'].headers['X-Test'] == 'value'
+        return await handler(request)
+
+    rpc_server = aiohttp_rpc.JsonRpcServer(middlewares=(test_middleware,))
+    rpc_server.add_method(method)
+
+    client = await utils.make_client(aiohttp_client, rpc_server)
+
+    async with TestRpcClient('/rpc', session=client) as rpc:
+        assert await rpc.call('method') == 'ok'
+        assert await rpc.method() == 'ok'
+        await rpc.notify('method')
+
+
+async def test_overridden_direct_batch(aiohttp_client):
+    headers = []
+
+    def method(rpc_request):
+        headers.append(rpc_request.context['http_request'].headers.get('X-Test'))
+        return headers[-1]
+
+    class TestRpcClient(aiohttp_rpc.JsonRpcClient):
+        async def direct_batch(self, batch_request, **kwargs):
+            return await super().direct_batch(batch_request, headers={'X-Test': 'value'}, **kwargs)
+
+    rpc_server = aiohttp_rpc.JsonRpcServer(middlewares=aiohttp_rpc.middlewares.DEFAULT_MIDDLEWARES)
+    rpc_server.add_method(method)
+
+    client = await utils.make_client(aiohttp_client, rpc_server)
+
+    async with TestRpcClient('/rpc', session=client) as rpc:
+        assert await rpc.batch(('method', 'method',)) == ('value', 'value',)
+        assert await rpc.batch(('method', 'method',), save_order=False) == ('value', 'value',)
+
+    async with TestRpcClient('/rpc', session=client) as rpc:
+        assert await rpc.batch_notify(('method', 'method',)) is None
+
+    assert headers == ['value', 'value', 'value', 'value', 'value', 'value']
+
+
+async def test_logging_middleware(aiohttp_client, caplog):
+    def method(a=1):
+        return a * 2
+
+    rpc_server = aiohttp_rpc.JsonRpcServer(middlewares=(aiohttp_rpc.middlewares.logging_middleware,))
+    rpc_server.add_method(method)
+
+    client = await utils.make_client(aiohttp_client, rpc_server)
+
+    async with aiohttp_rpc.JsonRpcClient('/rpc', session=client) as rpc:
+        with caplog.at_level(logging.WARNING, logger='aiohttp_rpc.middlewares'):
+            assert await rpc.call('method', 1) == 2
+
+        assert not [record for record in caplog.records if record.name == 'aiohttp_rpc.middlewares']
+
+        with caplog.at_level(logging.INFO, logger='aiohttp_rpc.middlewares'):
+            assert await rpc.call('method', 2) == 4
+
+        request_record, response_record = [
+            record
+            for record in caplog.records
+            if record.name == 'aiohttp_rpc.middlewares'
+        ]
+        assert request_record.request['method'] == 'method'
+        assert response_record.request == request_record.request
+        assert response_record.response['result'] == 4
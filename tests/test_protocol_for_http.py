@@ -1,6 +1,13 @@
 # https://www.jsonrpc.org/specification#examples
 
+import json
+import math
+import re
+import sys
+
 import pytest
+from aiohttp import web
+from multidict import CIMultiDict, CIMultiDictProxy
 
 import aiohttp_rpc
 from aiohttp_rpc import errors
@@ -268,3 +275,159 @@ async def test_rpc_call_with_different_invalid_batch(aiohttp_client):
             }, 'id': '5'},
             {'jsonrpc': '2.0', 'result': ['hello', 5], 'id': '9'},
         ]
+
+
+async def test_invalid_json_response(aiohttp_client):
+    async def handle_http_request(http_request):
+        if http_request.query.get('content_type') == 'text':
+            return web.Response(text='{}')
+
+        return web.Response(text='{"jsonrpc": "2.0", "result', content_type='application/json')
+
+    app = web.Application()
+    app.router.add_post('/rpc', handle_http_request)
+    client = await aiohttp_client(app)
+
+    async with aiohttp_rpc.JsonRpcClient('/rpc', session=client) as rpc:
+        with pytest.raises(errors.ParseError):
+            await rpc.call('method')
+
+    async with aiohttp_rpc.JsonRpcClient('/rpc?content_type=text', session=client) as rpc:
+        with pytest.raises(errors.ParseError):
+            await rpc.call('method')
+
+
+async def test_custom_codec(aiohttp_client):
+    async def handle_http_request(http_request):
+        assert http_request.content_type == 'application/x-test'
+        data = json.loads((await http_request.read())[::-1])
+        body = json.dumps({'jsonrpc': '2.0', 'id': data['id'], 'result': data['params']}).encode()[::-1]
+        return web.Response(body=body, content_type='application/x-test')
+
+    class TestRpcClient(aiohttp_rpc.JsonRpcClient):
+        default_headers = CIMultiDictProxy(CIMultiDict({'Content-Type': 'application/x-test'}))
+        content_type_re = re.compile(r'^application/x-test')
+
+        @staticmethod
+        def json_serialize_bytes(data):
+            return json.dumps(data).encode()[::-1]
+
+        @staticmethod
+        def json_deserialize(data):
+            return json.loads(data[::-1])
+
+    app = web.Application()
+    app.router.add_post('/rpc', handle_http_request)
+    client = await aiohttp_client(app)
+
+    async with TestRpcClient('/rpc', session=client) as rpc:
+        assert await rpc.call('method', 1, 2) == [1, 2]
+
+
+async def test_big_ints_and_non_finite_floats(aiohttp_client):
+    def method(value):
+        return value
+
+    rpc_server = aiohttp_rpc.JsonRpcServer()
+    rpc_server.add_method(method)
+
+    client = await utils.make_client(aiohttp_client, rpc_server)
+
+    async with aiohttp_rpc.JsonRpcClient('/rpc', session=client) as rpc:
+        assert await rpc.method(2 ** 70) == 2 ** 70
+        assert await rpc.method(-2 ** 70) == -2 ** 70
+        assert math.isnan(await rpc.method(math.nan))
+        assert await rpc.method(math.inf) == math.inf
+
+
+async def test_orjson(aiohttp_client):
+    pytest.importorskip('orjson')
+
+    def method(value):
+        return value
+
+    rpc_server = aiohttp_rpc.JsonRpcServer(
+        json_serialize=aiohttp_rpc.utils.orjson_serialize,
+        json_deserialize=aiohttp_rpc.utils.orjson_deserialize,
+    )
+    rpc_server.add_method(method)
+
+    client = await utils.make_client(aiohttp_client, rpc_server)
+
+    async with aiohttp_rpc.JsonRpcClient('/rpc', session=client) as rpc:
+        assert await rpc.method([1, 'a']) == [1, 'a']
+        # Ints out of the 64-bit range are encoded by `json`.
+        assert aiohttp_rpc.utils.orjson_serialize(2 ** 70) == str(2 ** 70)
+        assert aiohttp_rpc.utils.orjson_serialize_bytes([2 ** 70]) == f'[{2 ** 70}]'.encode()
+
+    get_bytes_serializer = aiohttp_rpc.utils.get_bytes_serializer
+    assert get_bytes_serializer(aiohttp_rpc.utils.orjson_serialize) is aiohttp_rpc.utils.orjson_serialize_bytes
+    assert get_bytes_serializer(aiohttp_rpc.utils.json_serialize) is aiohttp_rpc.utils.json_serialize_bytes
+    assert get_bytes_serializer(json.dumps) is None
+
+
+async def test_custom_json_serialize(aiohttp_client):
+    def method(value):
+        return value
+
+    class TestRpcClient(aiohttp_rpc.JsonRpcClient):
+        @staticmethod
+        def json_serialize(data):
+            return json.dumps(data, default=lambda value: 'custom')
+
+    rpc_server = aiohttp_rpc.JsonRpcServer()
+    rpc_server.add_method(method)
+
+    client = await utils.make_client(aiohttp_client, rpc_server)
+
+    async with TestRpcClient('/rpc', session=client) as rpc:
+        assert await rpc.method(object()) == 'custom'
+
+
+async def test_url_change(aiohttp_client):
+    def method():
+        return 'ok'
+
+    rpc_server = aiohttp_rpc.JsonRpcServer()
+    rpc_server.add_method(method)
+
+    client = await utils.make_client(aiohttp_client, rpc_server)
+
+    async with aiohttp_rpc.JsonRpcClient('/unknown', session=client) as rpc:
+        with pytest.raises(errors.ServerError):
+            await rpc.method()
+
+        rpc.url = '/rpc'
+        assert rpc.url == '/rpc'
+        assert await rpc.method() == 'ok'
+
+
+async def test_json_serialize_of_outer_session(aiohttp_client):
+    def method(value):
+        return value
+
+    rpc_server = aiohttp_rpc.JsonRpcServer()
+    rpc_server.add_method(method)
+
+    app = web.Application()
+    app.router.add_post('/rpc', rpc_server.handle_http_request)
+    client = await aiohttp_client(app, json_serialize=lambda data: json.dumps(data, default=lambda value: 'custom'))
+
+    async with aiohttp_rpc.JsonRpcClient('/rpc', session=client) as rpc:
+        assert await rpc.method(object()) == 'custom'
+
+
+@pytest.mark.parametrize('obj', (
+    aiohttp_rpc.JsonRpcRequest(id=1, method_name='method'),
+    aiohttp_rpc.JsonRpcBatchRequest(),
+    aiohttp_rpc.JsonRpcResponse(id=1, result=1),
+    aiohttp_rpc.JsonRpcBatchResponse(),
+))
+def test_ad_hoc_attributes(obj):
+    # Protocol classes use `__slots__` since Python 3.10.
+    if sys.version_info >= (3, 10):
+        with pytest.raises(AttributeError):
+            obj.custom_attr = 1
+    else:
+        obj.custom_attr = 1
+        assert obj.custom_attr == 1
@@ -1,5 +1,9 @@
 import asyncio
 import datetime
+import json
+
+import pytest
+from aiohttp import web
 
 import aiohttp_rpc
 from tests import utils
@@ -19,6 +23,192 @@ async def test_args(aiohttp_client):
         assert await rpc.call('method', 1) == [1, 2, 1]
 
 
+async def test_timeout_for_data_receiving(aiohttp_client):
+    def method(a=1):
+        return [1, 2, a]
+
+    rpc_server = aiohttp_rpc.WsJsonRpcServer()
+    rpc_server.add_method(method)
+
+    client = await utils.make_ws_client(aiohttp_client, rpc_server)
+
+    async with aiohttp_rpc.WsJsonRpcClient('/rpc', session=client, timeout_for_data_receiving=0.1) as rpc:
+        assert await rpc.call('method') == [1, 2, 1]
+        await asyncio.sleep(0.2)
+        assert await rpc.call('method', 1) == [1, 2, 1]
+
+
+async def test_without_send_frame(aiohttp_client):
+    def method(a=1):
+        return [1, 2, a]
+
+    rpc_server = aiohttp_rpc.WsJsonRpcServer()
+    rpc_server.add_method(method)
+
+    client = await utils.make_ws_client(aiohttp_client, rpc_server)
+
+    async with aiohttp_rpc.WsJsonRpcClient('/rpc', session=client) as rpc:
+        rpc._send_frame = None  # Like in old versions of aiohttp.
+        assert await rpc.call('method') == [1, 2, 1]
+
+
+async def test_binary_frames(aiohttp_client):
+    def method(a=1):
+        return [1, 2, a]
+
+    rpc_server = aiohttp_rpc.WsJsonRpcServer()
+    rpc_server.add_method(method)
+
+    client = await utils.make_ws_client(aiohttp_client, rpc_server)
+
+    async with aiohttp_rpc.WsJsonRpcClient('/rpc', session=client, use_binary_frames=True) as rpc:
+        assert await rpc.call('method') == [1, 2, 1]
+        assert await rpc.batch(('method', ('method', 2),)) == ([1, 2, 1], [1, 2, 2],)
+
+
+async def test_large_messages(aiohttp_client):
+    def method(a=1):
+        return [1, 2, a]
+
+    rpc_server = aiohttp_rpc.WsJsonRpcServer()
+    rpc_server.add_method(method)
+
+    client = await utils.make_ws_client(aiohttp_client, rpc_server)
+
+    async with aiohttp_rpc.WsJsonRpcClient('/rpc', session=client, large_message_size=10) as rpc:
+        assert await rpc.call('method') == [1, 2, 1]
+        assert await rpc.batch(('method', ('method', 2),)) == ([1, 2, 1], [1, 2, 2],)
+
+
+async def test_custom_codec(aiohttp_client, mocker):
+    def method(a=1):
+        return [1, 2, a]
+
+    rpc_server = aiohttp_rpc.WsJsonRpcServer()
+    rpc_server.add_method(method)
+
+    client = await utils.make_ws_client(aiohttp_client, rpc_server)
+
+    json_serialize = mocker.Mock(side_effect=json.dumps)
+    json_deserialize = mocker.Mock(side_effect=json.loads)
+
+    async with aiohttp_rpc.WsJsonRpcClient(
+            '/rpc',
+            session=client,
+            use_binary_frames=True,
+            json_serialize=json_serialize,
+            json_deserialize=json_deserialize,
+    ) as rpc:
+        assert await rpc.call('method') == [1, 2, 1]
+        assert json_serialize.call_count == 1
+        assert json_deserialize.call_count == 1
+
+
+async def test_text_frames_of_bytes(aiohttp_client, mocker):
+    pytest.importorskip('orjson')
+
+    def method(a=1):
+        return [1, 2, a]
+
+    rpc_server = aiohttp_rpc.WsJsonRpcServer()
+    rpc_server.add_method(method)
+
+    client = await utils.make_ws_client(aiohttp_client, rpc_server)
+
+    async with aiohttp_rpc.WsJsonRpcClient(
+            '/rpc',
+            session=client,
+            json_serialize=aiohttp_rpc.utils.orjson_serialize,
+    ) as rpc:
+        send_frame = mocker.patch.object(rpc, '_send_frame', side_effect=rpc._send_frame)
+        send_str = mocker.patch.object(rpc, '_send_str', side_effect=rpc._send_str)
+        assert await rpc.call('method') == [1, 2, 1]
+        assert send_frame.call_count == 1
+        assert isinstance(send_frame.call_args.args[0], bytes)
+        assert send_str.call_count == 0
+
+    # A custom `json_serialize` produces `str`, so it is sent as is.
+    async with aiohttp_rpc.WsJsonRpcClient('/rpc', session=client, json_serialize=json.dumps) as rpc:
+        send_frame = mocker.patch.object(rpc, '_send_frame', side_effect=rpc._send_frame)
+        send_str = mocker.patch.object(rpc, '_send_str', side_effect=rpc._send_str)
+        assert await rpc.call('method') == [1, 2, 1]
+        assert send_frame.call_count == 0
+        assert send_str.call_count == 1
+
+
+async def test_server_json_deserialize(aiohttp_client, mocker):
+    def method(a=1):
+        return a
+
+    json_deserialize = mocker.Mock(side_effect=json.loads)
+    rpc_server = aiohttp_rpc.WsJsonRpcServer(json_deserialize=json_deserialize)
+    rpc_server.add_method(method)
+
+    client = await utils.make_ws_client(aiohttp_client, rpc_server)
+
+    async with aiohttp_rpc.WsJsonRpcClient('/rpc', session=client) as rpc:
+        assert await rpc.call('method', 2) == 2
+        assert json_deserialize.call_count == 1
+
+
+async def test_writer_limit(aiohttp_client):
+    def method(a=1):
+        return a
+
+    rpc_server = aiohttp_rpc.WsJsonRpcServer(ws_response_kwargs={'writer_limit': 2 ** 20})
+    rpc_server.add_method(method)
+
+    client = await utils.make_ws_client(aiohttp_client, rpc_server)
+
+    async with aiohttp_rpc.WsJsonRpcClient('/rpc', session=client, writer_limit=2 ** 20) as rpc:
+        assert rpc.ws_connect._writer._limit == 2 ** 20
+        assert await rpc.call('method', 2) == 2
+
+
+async def test_writer_limit_without_writer(caplog):
+    rpc = aiohttp_rpc.WsJsonRpcClient('/rpc', writer_limit=2 ** 20)
+    rpc.ws_connect = object()  # Like a version of `aiohttp` without `_writer`
+    rpc._set_writer_limit(2 ** 20)
+
+    assert [
+        record.getMessage()
+        for record in caplog.records
+        if record.name == 'aiohttp_rpc.client.websocket'
+    ] == ['Can\'t set the writer limit, it isn\'t supported by this version of aiohttp.']
+
+
+async def test_batch_window(aiohttp_client, mocker):
+    def method(a=1):
+        return a
+
+    def method_with_error():
+        raise aiohttp_rpc.errors.InvalidParams
+
+    rpc_server = aiohttp_rpc.WsJsonRpcServer()
+    rpc_server.add_methods((method, method_with_error,))
+
+    client = await utils.make_ws_client(aiohttp_client, rpc_server)
+
+    async with aiohttp_rpc.WsJsonRpcClient('/rpc', session=client, batch_window=0.01) as rpc:
+        send_data = mocker.spy(rpc, '_send_data')
+
+        results = await asyncio.gather(
+            rpc.call('method', 1),
+            rpc.call('method', 2),
+            rpc.notify('method', 3),
+            rpc.call('method_with_error'),
+            return_exceptions=True,
+        )
+
+        assert results[:3] == [1, 2, None]
+        assert isinstance(results[3], aiohttp_rpc.errors.InvalidParams)
+        assert send_data.call_count == 1
+
+        assert await rpc.call('method', 4) == 4
+        assert await rpc.batch(('method', ('method', 5),)) == (1, 5,)
+        assert send_data.call_count == 3
+
+
 async def test_batch(aiohttp_client):
     def method_1(a=1):
         return [1, a]
@@ -103,3 +293,96 @@ async def test_ws_client_for_server_response(aiohttp_client, mocker):
         assert results[0]['method'] == 'ping'
         assert results[1]['method'] == 'ping'
         assert results[2]['method'] == 'ping'
+
+
+async def test_timeout(aiohttp_client):
+    async def method(a):
+        await asyncio.sleep(a)
+        return a
+
+    rpc_server = aiohttp_rpc.WsJsonRpcServer()
+    rpc_server.add_method(method)
+
+    client = await utils.make_ws_client(aiohttp_client, rpc_server)
+
+    async with aiohttp_rpc.WsJsonRpcClient('/rpc', session=client, timeout=0.2) as rpc:
+        with pytest.raises(asyncio.TimeoutError):
+            await rpc.call('method', 1)
+
+        assert not rpc._pending
+        assert await rpc.call('method', 0) == 0
+
+        results = await asyncio.gather(rpc.call('method', 1), rpc.call('method', 1), return_exceptions=True)
+        assert [type(result) for result in results] == [asyncio.TimeoutError, asyncio.TimeoutError]
+        assert not rpc._pending
+
+
+async def test_timeout_precision(aiohttp_client):
+    async def method(a):
+        await asyncio.sleep(a)
+        return a
+
+    rpc_server = aiohttp_rpc.WsJsonRpcServer()
+    rpc_server.add_method(method)
+
+    client = await utils.make_ws_client(aiohttp_client, rpc_server)
+    loop = asyncio.get_running_loop()
+
+    async with aiohttp_rpc.WsJsonRpcClient('/rpc', session=client, timeout=0.01) as rpc:
+        started_at = loop.time()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await rpc.call('method', 1)
+
+        assert 0.01 <= loop.time() - started_at < 0.05
+
+
+async def test_timeout_resolution(aiohttp_client):
+    async def method(a):
+        await asyncio.sleep(a)
+        return a
+
+    class TestRpcClient(aiohttp_rpc.WsJsonRpcClient):
+        timeout_resolution = 0.1
+
+    rpc_server = aiohttp_rpc.WsJsonRpcServer()
+    rpc_server.add_method(method)
+
+    client = await utils.make_ws_client(aiohttp_client, rpc_server)
+    loop = asyncio.get_running_loop()
+
+    async with TestRpcClient('/rpc', session=client, timeout=0.2) as rpc:
+        started_at = loop.time()
+
+        # Close deadlines share one timer.
+        results = await asyncio.gather(rpc.call('method', 1), rpc.call('method', 1), return_exceptions=True)
+        assert [type(result) for result in results] == [asyncio.TimeoutError, asyncio.TimeoutError]
+        assert 0.2 <= loop.time() - started_at < 0.35
+        assert not rpc._pending
+        assert not rpc._timeout_buckets
+
+        assert await rpc.call('method', 0) == 0
+        # The request is removed from its bucket when it is done.
+        assert all(not timeout_bucket for timeout_bucket in rpc._timeout_buckets.values())
+
+
+async def test_unhashable_ids_in_batch_response(aiohttp_client):
+    async def handle_ws_request(http_request):
+        ws_connect = web.WebSocketResponse()
+        await ws_connect.prepare(http_request)
+
+        async for ws_msg in ws_connect:
+            json_request = json.loads(ws_msg.data)
+            # A broken server sends unhashable ids.
+            await ws_connect.send_str(json.dumps([{'jsonrpc': '2.0', 'id': [json_request['id']], 'result': 1}]))
+            await ws_connect.send_str(json.dumps({'jsonrpc': '2.0', 'id': json_request['id'], 'result': 2}))
+
+        return ws_connect
+
+    app = web.Application()
+    app.router.add_get('/rpc', handle_ws_request)
+    client = await aiohttp_client(app)
+
+    async with aiohttp_rpc.WsJsonRpcClient('/rpc', session=client, timeout=1) as rpc:
+        assert await rpc.call('method') == 2
+        assert await rpc.call('method') == 2